@@ -168,26 +168,32 @@ class DocumentAnalyzerADKAgent(LlmAgent):
 
             # Create PRD object
             prd_id = data.get("prd_id", "generated_prd_" + str(int(time.time())))
-            prd = PRD(
-                id=prd_id,
-                title=data.get("prd_title") or "Unknown PRD Title",
-                description=data.get("prd_description") or "",
-                author=data.get("prd_author") or "Unknown Author",
-                version=data.get("prd_version") or "0.0.0",
-                created_at=current_time,
-                updated_at=current_time,
+            # LLM output is untrusted, so it is validated into the models
+            prd = PRD.from_dict(
+                {
+                    "id": prd_id,
+                    "title": data.get("prd_title") or "Unknown PRD Title",
+                    "description": data.get("prd_description") or "",
+                    "author": data.get("prd_author") or "Unknown Author",
+                    "version": data.get("prd_version") or "0.0.0",
+                    "created_at": current_time,
+                    "updated_at": current_time,
+                }
             )
 
-            extracted_features: list[Feature] = []
-            for i, feature_data in enumerate(data.get("features", [])):
-                feature = Feature(
-                    id=feature_data.get("id", f"{prd_id}_feature_{i:02d}"),
-                    name=feature_data.get("name") or f"Unnamed Feature {i + 1}",
-                    description=feature_data.get("description") or "",
-                    requirements=feature_data.get("requirements", []),
-                    dependencies=feature_data.get("dependencies", []),
-                )
-                extracted_features.append(feature)
+            extracted_features = Feature.list_from_dicts(
+                [
+                    {
+                        "id": feature_data.get("id", f"{prd_id}_feature_{i:02d}"),
+                        "title": feature_data.get("name")
+                        or f"Unnamed Feature {i + 1}",
+                        "description": feature_data.get("description") or "",
+                        "requirements": feature_data.get("requirements", []),
+                        "dependencies": feature_data.get("dependencies", []),
+                    }
+                    for i, feature_data in enumerate(data.get("features", []))
+                ]
+            )
 
             prd.features = extracted_features
 
@@ -129,29 +129,34 @@ def generate_xml_templates(
                 depends_on=[],  # Will be determined by sequence planner
             )
 
-            from marvin.core.domain.models import Feature, FeatureStatus
-
-            feature = Feature(
-                id=feature_data["id"],
-                name=feature_data["name"],
-                description=feature_data["description"],
-                requirements=feature_data["requirements"],
-                dependencies=feature_data["dependencies"],
-                priority=feature_data["priority"],
-                status=FeatureStatus(feature_data["status"]),
+            from marvin.core.domain.models import Feature
+
+            # Session data is untrusted JSON, so validate it into the models
+            feature = Feature.from_dict(
+                {
+                    "id": feature_data["id"],
+                    "title": feature_data["name"],
+                    "description": feature_data["description"],
+                    "requirements": feature_data["requirements"],
+                    "dependencies": feature_data["dependencies"],
+                    "priority": feature_data["priority"],
+                    "status": feature_data["status"],
+                }
             )
 
             # Reconstruct PRD object
             from marvin.core.domain.models import PRD
 
-            prd_obj = PRD(
-                id=prd["id"],
-                title=prd["title"],
-                description=prd["description"],
-                author=prd["author"],
-                version=prd["version"],
-                created_at=datetime.fromisoformat(prd["created_at"]),
-                updated_at=datetime.fromisoformat(prd["updated_at"]),
+            prd_obj = PRD.from_dict(
+                {
+                    "id": prd["id"],
+                    "title": prd["title"],
+                    "description": prd["description"],
+                    "author": prd["author"],
+                    "version": prd["version"],
+                    "created_at": prd["created_at"],
+                    "updated_at": prd["updated_at"],
+                }
             )
 
             # Generate XML template
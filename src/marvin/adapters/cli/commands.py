@@ -122,7 +122,7 @@ def analyze_prd_command(
             for i, path in enumerate(template_paths, 1):
                 rel_path = os.path.relpath(path, os.getcwd())
                 console.print(f"  {i}. [blue]{rel_path}[/blue]")
-                logger.debug(f"Generated template {i}: {rel_path}")
+                logger.debug("Generated template {}: {}", i, rel_path)
 
             console.print(
                 "\nYou can now use these templates with your preferred AI coding assistant."
@@ -76,7 +76,7 @@ class Agent(abc.ABC):
             The configuration value or the default value
         """
         value = self.config.get(key, default)
-        self.logger.debug(f"Retrieved config {key}={value}")
+        self.logger.debug("Retrieved config {}={}", key, value)
         return value
 
     def set_config(self, key: str, value: Any) -> None:
@@ -86,7 +86,7 @@ class Agent(abc.ABC):
             key: Key of the configuration value
             value: Value of the configuration value
         """
-        self.logger.debug(f"Setting config {key}={value}")
+        self.logger.debug("Setting config {}={}", key, value)
         self.config[key] = value
 
     def __str__(self) -> str:
@@ -1,11 +1,21 @@
 """Agent for analyzing Product Requirements Documents (PRDs)."""
 
+import asyncio
+import codecs
+import io
+import mmap
 import os
 import re
+import sys
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple, overload
 
 try:
     import frontmatter
@@ -16,10 +26,457 @@ try:
 except ImportError:
     ENHANCED_PARSING_AVAILABLE = False
 
+try:
+    # Linear-time engine for patterns run over untrusted document text
+    import re2
+
+    _compile_linear: Callable[[str], re.Pattern[str]] = re2.compile
+except ImportError:
+    _compile_linear = re.compile
+
 from marvin.core.agents.base import Agent
 from marvin.core.domain.models import PRD, Feature, FeatureStatus, UserStory
 
 
+class _SlugTable(dict[int, int | None]):
+    """``str.translate`` table keeping ``[a-z0-9-]`` and whitespace only.
+
+    Entries are filled lazily so arbitrary Unicode input is handled without
+    precomputing the whole code point range.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        keep = char.isspace() or (char.isascii() and (char.isalnum() or char == "-"))
+        self[codepoint] = codepoint if keep else None
+        return self[codepoint]
+
+
+_SLUG_TABLE = _SlugTable()
+
+# Documents at least this large are memory-mapped instead of read into a buffer.
+_MMAP_THRESHOLD = 256 * 1024
+
+# Documents with CR line endings are decoded in chunks of this many bytes.
+_DECODE_CHUNK_SIZE = 64 * 1024
+
+
+def _decode_translating_newlines(data: bytearray | mmap.mmap) -> str:
+    """Decodes UTF-8 data and normalizes CRLF and CR line endings to LF.
+
+    Decoding and translation happen in one streaming pass over fixed-size
+    chunks, instead of decoding everything and then rewriting the full text
+    once per line ending kind.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(), translate=True
+    )
+    with memoryview(data) as view:
+        parts = [
+            decoder.decode(view[start : start + _DECODE_CHUNK_SIZE])
+            for start in range(0, len(view), _DECODE_CHUNK_SIZE)
+        ]
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+# Marker lines opening a requirements block, lowercased.
+_REQUIREMENT_MARKERS = frozenset({"**requirements:**", "**requirement:**"})
+
+
+def _bullet_text(line: str) -> str | None:
+    """Returns the text of a "-" or "*" bullet line, or None for other lines."""
+    body = line.lstrip(" \t")
+    if body[:1] not in ("-", "*") or body[1:2] not in (" ", "\t"):
+        return None
+    return body[1:].strip(" \t") or None
+
+
+def _strip_requirement_id(item: str) -> str:
+    """Strips a leading "REQ-1:" or "REQ-1.2:" ID from a requirement."""
+    if not item.startswith("REQ-"):
+        return item
+    colon = item.find(":", 4)
+    if colon < 0 or item[colon + 1 : colon + 2] not in (" ", "\t"):
+        return item
+    major, dot, minor = item[4:colon].partition(".")
+    if not major.isdecimal() or (dot and not minor.isdecimal()):
+        return item
+    return item[colon + 1 :].lstrip(" \t")
+
+
+class _Section(NamedTuple):
+    """A Markdown heading, its offset and the character range of its body."""
+
+    level: int
+    title: str
+    offset: int
+    start: int
+    end: int
+
+
+def _split_sections(content: str) -> list[_Section]:
+    """Splits Markdown content into sections in a single pass over its lines.
+
+    A section body runs from the line after its heading to the next heading of
+    the same or a higher level, so it includes its own subsections. Lines
+    inside fenced code blocks are never treated as headings.
+    """
+    sections: list[_Section] = []
+    open_sections: list[int] = []
+    in_fence = False
+    length = len(content)
+    pos = 0
+
+    while pos < length:
+        eol = content.find("\n", pos)
+        line_end = length if eol < 0 else eol
+        next_pos = line_end + 1
+
+        if content.startswith(("```", "~~~"), pos):
+            in_fence = not in_fence
+        elif not in_fence and content.startswith("#", pos):
+            line = content[pos:line_end]
+            text = line.lstrip("#")
+            level = len(line) - len(text)
+            if level <= 6 and (not text or text[0] in " \t"):
+                while open_sections and sections[open_sections[-1]].level >= level:
+                    index = open_sections.pop()
+                    sections[index] = sections[index]._replace(end=pos)
+                open_sections.append(len(sections))
+                sections.append(
+                    _Section(
+                        level, text.strip(), pos, min(next_pos, length), length
+                    )
+                )
+
+        pos = next_pos
+
+    return sections
+
+
+def _find_subsections(
+    sections: list[_Section], title_re: re.Pattern[str]
+) -> list[_Section] | None:
+    """Returns the H3 subsections of the first H2 section matching title_re.
+
+    Returns None if there is no such H2 section.
+    """
+    for index, section in enumerate(sections):
+        if section.level == 2 and title_re.fullmatch(section.title):
+            return [
+                child
+                for child in sections[index + 1 :]
+                if child.start <= section.end and child.level == 3
+            ]
+    return None
+
+
+def _iter_split(text: str, separator: str) -> Iterator[str]:
+    """Lazily yields the same pieces as text.split(separator).
+
+    Lets scans that stop at the first match avoid splitting the whole text.
+    """
+    start = 0
+    while (end := text.find(separator, start)) >= 0:
+        yield text[start:end]
+        start = end + len(separator)
+    yield text[start:]
+
+
+def _iter_feature_table_rows(content: str) -> Iterator[tuple[int, list[str]]]:
+    """Yields the data rows of every feature table in a single pass over lines.
+
+    A feature table has a header row with at least six cells, one of which
+    mentions "Feature", directly followed by a separator row. Its data rows are
+    the "|" lines that follow. Rows are yielded as their index in the table and
+    their stripped cells.
+    """
+    lines = _iter_split(content, "\n")
+    previous = ""
+    for line in lines:
+        row = line.strip()
+        if "-" in row and _TABLE_SEPARATOR_RE.fullmatch(row):
+            header = previous.split("|")[1:-1]
+            if (
+                previous.startswith("|")
+                and len(header) >= 6
+                and any("feature" in cell.lower() for cell in header)
+            ):
+                index = 0
+                for line in lines:
+                    row = line.strip()
+                    if not row.startswith("|"):
+                        break
+                    yield index, [cell.strip() for cell in row.split("|")[1:-1]]
+                    index += 1
+        previous = row
+
+
+# Titles of the H2 section holding the features.
+_FEATURES_TITLE_RE = re.compile(r"Features?", re.IGNORECASE)
+_NUMBERED_FEATURES_TITLE_RE = re.compile(r"(?:\d+\.\s*)?Features?", re.IGNORECASE)
+
+# Document metadata anchors. Prefixed H1 titles are preferred over any H1.
+_TITLE_RES = (
+    re.compile(r"Product Requirements Document:\s*(.+)"),
+    re.compile(r"PRD:\s*(.+)"),
+)
+_VERSION_RE = re.compile(r"Version:\s*(\S+)", re.IGNORECASE)
+_AUTHOR_RE = re.compile(r"Author:\s*(.+?)(?:\n|$)", re.IGNORECASE)
+
+# Metadata labels are looked up with str.find in this many leading characters.
+_METADATA_HEAD_SIZE = 4096
+
+
+def _search_label(
+    content: str, label: str, pattern: re.Pattern[str]
+) -> re.Match[str] | None:
+    """Searches content for pattern, which starts with the lowercase label.
+
+    Labels like "Version:" usually sit near the top of a PRD, so the head of
+    the document is scanned with str.find first and the pattern is only
+    matched there. The full regex search is the fallback.
+    """
+    head = content[:_METADATA_HEAD_SIZE]
+    lowered = head.lower()
+    # Lowercasing a few code points changes the length and shifts offsets
+    if len(lowered) == len(head):
+        index = lowered.find(label)
+        if index >= 0:
+            return pattern.match(content, index)
+    return pattern.search(content)
+
+
+# Per-feature "**Label:** value" fields; `.` stops at the end of the line.
+_DEPENDENCIES_FIELD_RE = re.compile(r"\*\*Dependencies?:\*\*\s*(.+)", re.IGNORECASE)
+_PRIORITY_FIELD_RE = re.compile(r"\*\*Priority:\*\*\s*(.+)", re.IGNORECASE)
+
+# Titles of overview-like sections holding the PRD description, in order of
+# preference.
+_DESCRIPTION_TITLE_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:Executive\s+)?Overview",
+        r"Executive\s+Summary",
+        r"(?:Project\s+)?Description",
+    )
+)
+
+# Feature name prefixes such as "Feature 1:" or "1." in the basic parser.
+_FEATURE_NAME_PREFIX_RE = re.compile(r"(?:Feature\s*\d+:?\s*)?(?:\d+\.\s*)?")
+
+# Feature title clean-up of the enhanced section parser.
+_FEATURE_PREFIX_RE = re.compile(r"^Feature\s*\d*:\s*", re.IGNORECASE)
+_NUMBERED_PREFIX_RE = re.compile(r"^\d+\.?\d*\s+")
+
+# Separator row below a Markdown table header, e.g. "|---|:---:|".
+_TABLE_SEPARATOR_RE = re.compile(r"\|[\s:\-|]*")
+
+# Priority and effort hints, in order of preference.
+_PRIORITY_TEXT_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\*\*Priority\*\*:\s*(\w+)",
+        r"Priority:\s*(\w+)",
+        r"\*\*(\w+)\s+priority\*\*",
+        r"(\w+)\s+priority",
+        r"priority\s*[:\-]\s*(\w+)",
+    )
+)
+
+# Priority labels accepted from explicit hints and their numeric priority.
+_PRIORITY_LABELS = frozenset(
+    {"High", "Medium", "Low", "Critical", "Must", "Should", "Could"}
+)
+_PRIORITY_MAP: Mapping[str, int] = MappingProxyType(
+    {
+        "High": 0,
+        "Critical": 0,
+        "Must Have": 0,
+        "Must": 0,
+        "Medium": 1,
+        "Should Have": 1,
+        "Should": 1,
+        "Low": 2,
+        "Could Have": 2,
+        "Could": 2,
+    }
+)
+
+# Priority keywords matched as substrings of lowercase text, in precedence
+# order: "**Priority:**" field values, then natural language phrases.
+_PRIORITY_FIELD_KEYWORDS = (
+    (0, ("high", "p0")),
+    (1, ("medium", "p1")),
+    (2, ("low", "p2")),
+)
+_PRIORITY_PHRASES = (
+    ("High", ("critical", "must have", "high priority")),
+    ("Medium", ("should have", "medium priority")),
+    ("Low", ("could have", "low priority", "nice to have")),
+)
+
+_EFFORT_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\*\*Effort\*\*:\s*(\d+\s*(?:SP|story points?|weeks?|days?))",
+        r"Effort:\s*(\d+\s*(?:SP|story points?|weeks?|days?))",
+        r"(\d+)\s*story\s*points?",
+        r"(\d+)\s*SP\b",
+        r"(\d+)\s*weeks?",
+        r"(\d+)\s*days?",
+    )
+)
+
+# Feature sub-sections of the enhanced section parser. A section body runs up
+# to the next heading or bold label, which is matched rather than looked ahead
+# for, since re2 has no lookarounds; only group 1 is read. Without the
+# MULTILINE flag "$" is the end of the content (the stdlib engine also allows
+# a final newline, which the callers strip).
+_FEATURE_DESCRIPTION_RES = tuple(
+    _compile_linear(pattern)
+    for pattern in (
+        r"(?is)(?:^|\n)#+\s*Description\s*\n(.*?)(?:\n#|\n\*\*|$)",
+        r"(?is)(?:^|\n)\*\*Description\*\*[:\s]*\n(.*?)(?:\n\*\*|\n#|$)",
+    )
+)
+_AS_A_STORY_RE = re.compile(
+    r"(?:^|\n)[\s*-]*As\s+(?:a|an)\s+([^,]+),\s*I\s+want\s+([^,]+),?\s*so\s+that\s+(.+?)(?=\n|$)",
+    re.MULTILINE | re.IGNORECASE,
+)
+_GIVEN_WHEN_THEN_STORY_RE = re.compile(
+    r"(?:^|\n)[\s*-]*Given\s+([^,]+),?\s*When\s+([^,]+),?\s*Then\s+(.+?)(?=\n|$)",
+    re.MULTILINE | re.IGNORECASE,
+)
+_SIMPLE_STORY_RE = re.compile(
+    r"(?:^|\n)[\s*-]+(User|System|Admin).+?(?=\n|$)", re.MULTILINE | re.IGNORECASE
+)
+_ACCEPTANCE_CRITERIA_RE = _compile_linear(
+    r"(?is)(?:^|\n)#+\s*Acceptance\s+Criteria\s*\n(.*?)(?:\n#|\n\*\*|$)"
+)
+_CRITERIA_ITEM_RE = _compile_linear(r"(?m)(?:^|\n)[\s]*(?:\d+\.|\-|\*)\s*(.+?)$")
+_DEFINITION_OF_DONE_RE = _compile_linear(
+    r"(?is)(?:^|\n)#+\s*Definition\s+of\s+Done\s*\n(.*?)(?:\n#|\n\*\*|$)"
+)
+_DOD_ITEM_RE = _compile_linear(
+    r"(?m)(?:^|\n)[\s]*(?:-\s*\[\s*\]|\-|\*)\s*(.+?)$"
+)
+
+# Dependency sections, bullet items and clean-up. The section forms are
+# lookahead alternatives of one pattern, so the content is scanned once and
+# each form is found at the same place as if it were searched on its own.
+# The block form is anchored at a newline, so the inline form still gets
+# line starts; at the start of the content, it is matched inside the block
+# alternative as "leading_inline".
+_DEPENDENCY_SECTION_FORMS = ("heading", "block", "inline", "plain")
+_DEPENDENCY_SECTION_RE = re.compile(
+    r"(?=(?:^|\n)#+\s*Dependencies\s*\n(?P<heading>.*?)(?=\n#+|\n\*\*|\Z))"
+    r"|(?=(?:\A|\n)\*\*Dependencies\*\*[:\s]*\n?(?P<block>.*?)(?=\n\*\*|\n#+|\Z))"
+    r"(?=\*\*Dependencies\*\*:\s*(?P<leading_inline>.+?)(?=\n|$))?"
+    r"|(?=\*\*Dependencies\*\*:\s*(?P<inline>.+?)(?=\n|$))"
+    r"|(?=Dependencies:\s*(?P<plain>.+?)(?=\n|$))",
+    re.MULTILINE | re.DOTALL | re.IGNORECASE,
+)
+_DEPENDENCY_ITEM_RE = _compile_linear(r"(?m)(?:^|\n)[\s]*(?:\-|\*)\s*(.+?)$")
+_PARENTHETICAL_RE = re.compile(r"\s*\([^)]*\)\s*")
+
+
+def _clean_dependency(text: str) -> str:
+    """Removes parenthetical references like "(2.1)" and extra whitespace.
+
+    Most dependencies have no parentheses, so the pattern only runs on the
+    ones that do.
+    """
+    if "(" in text:
+        text = _PARENTHETICAL_RE.sub("", text)
+    return " ".join(text.split())
+
+
+class _FeatureHints(NamedTuple):
+    """Which optional parts a feature body can contain at all."""
+
+    requirements: bool
+    user_stories: bool
+    acceptance_criteria: bool
+    definition_of_done: bool
+    dependencies: bool
+
+
+def _scan_feature_hints(feature_content: str) -> _FeatureHints:
+    """Classifies a feature body with one lowercase copy and substring tests.
+
+    Each hint is a keyword every pattern of the matching extractor requires,
+    so extractors whose hint is False can be skipped without changing results.
+    """
+    text = feature_content.lower()
+    return _FeatureHints(
+        requirements="**requirement" in text,
+        user_stories=any(
+            word in text for word in ("want", "given", "user", "system", "admin")
+        ),
+        acceptance_criteria="acceptance" in text,
+        definition_of_done="definition" in text,
+        dependencies="dependencies" in text,
+    )
+
+
+class LazyFeatures(Sequence[Feature]):
+    """Features of a PRD that are parsed only when they are accessed.
+
+    Finding the feature sections and their titles is cheap, but extracting
+    requirements, user stories and criteria is not. Callers that only need
+    the titles read ``titles`` and skip that work. Each feature is built at
+    most once.
+    """
+
+    def __init__(self, titles: list[str], build: Callable[[int], Feature]):
+        """Initializes the sequence.
+
+        Args:
+            titles: Title of each feature, in document order
+            build: Parses the feature at the given index
+        """
+        self.titles = titles
+        self._build = build
+        self._features: list[Feature | None] = [None] * len(titles)
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    @overload
+    def __getitem__(self, index: int) -> Feature: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Feature]: ...
+
+    def __getitem__(self, index: int | slice) -> Feature | list[Feature]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self))[index]  # Normalizes negative indices
+        feature = self._features[index]
+        if feature is None:
+            feature = self._features[index] = self._build(index)
+        return feature
+
+
+# Feature parsing is pure Python, so worker threads only pay off on
+# interpreters running without the GIL (free-threaded CPython 3.13+).
+_gil_enabled: Callable[[], bool] = getattr(sys, "_is_gil_enabled", lambda: True)
+
+# Documents with fewer features are parsed on the calling thread.
+_PARALLEL_FEATURE_THRESHOLD = 4
+
+
+def _parse_all(features: LazyFeatures) -> list[Feature]:
+    """Parses every feature, on a thread pool when threads run in parallel."""
+    count = len(features)
+    if count < _PARALLEL_FEATURE_THRESHOLD or _gil_enabled():
+        return list(features)
+    with ThreadPoolExecutor(max_workers=min(8, count)) as executor:
+        return list(executor.map(features.__getitem__, range(count)))
+
+
 class DocumentAnalysisAgent(Agent):
     """Agent for analyzing PRDs and extracting features and requirements."""
 
@@ -33,15 +490,31 @@ class DocumentAnalysisAgent(Agent):
             config: Configuration of the agent
         """
         super().__init__(name, config)
+        self._cache_size: int = self.get_config("analysis_cache_size", 128)
+        self._analysis_cache: OrderedDict[
+            tuple[Any, ...], tuple[PRD, list[Feature]]
+        ] = OrderedDict()
+        # Built once; MarkdownIt keeps all parse state per call, so the same
+        # instance can be shared by the worker threads running the parser
+        self._md = (
+            MarkdownIt("commonmark", {"breaks": True, "html": True})
+            .use(front_matter_plugin)
+            .use(tasklists_plugin)
+            if ENHANCED_PARSING_AVAILABLE
+            else None
+        )
 
     async def execute(
         self, document_path: str, **kwargs: Any
-    ) -> tuple[PRD, list[Feature]]:
+    ) -> tuple[PRD, Sequence[Feature]]:
         """Analyzes a PRD and extracts features and requirements.
 
         Args:
             document_path: Path to the PRD document
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters. With ``lazy=True``, Markdown
+                features are returned as LazyFeatures and parsed on access.
+                Lazy results are not cached, and the enhanced parser leaves
+                the dependency graph empty since it needs every feature.
 
         Returns:
             Tuple of PRD and extracted features
@@ -50,17 +523,32 @@ class DocumentAnalysisAgent(Agent):
             FileNotFoundError: If the document was not found
             ValueError: If the document does not have a supported format
         """
-        self.logger.info(f"Starting document analysis for: {document_path}")
+        self.logger.info("Starting document analysis for: {}", document_path)
 
-        if not os.path.exists(document_path):
+        # One stat both checks that the document exists and keys the cache
+        try:
+            stat = os.stat(document_path)
+        except (OSError, ValueError):
             self.logger.error(f"Document not found: {document_path}")
-            raise FileNotFoundError(f"Document not found: {document_path}")
+            raise FileNotFoundError(f"Document not found: {document_path}") from None
 
         # Determine file type
         file_ext = Path(document_path).suffix.lower()
-        self.logger.debug(f"Detected document format: {file_ext}")
+        self.logger.debug("Detected document format: {}", file_ext)
 
-        start_time = time.time()
+        # Copying a lazy result for the cache would parse every feature
+        cache_key = (
+            None
+            if kwargs.get("lazy")
+            else self._get_cache_key(document_path, kwargs, stat)
+        )
+        cached = self._analysis_cache.get(cache_key) if cache_key else None
+        if cache_key and cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            self.logger.debug("Using cached analysis for: {}", document_path)
+            return self._copy_result(cached)
+
+        start_time = time.perf_counter()
         try:
             if file_ext == ".md":
                 self.logger.info("Processing Markdown document")
@@ -76,29 +564,77 @@ class DocumentAnalysisAgent(Agent):
                 self.logger.error(error_msg)
                 raise ValueError(error_msg)
 
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             prd, features = result
-            self.logger.info(f"Document analysis completed in {elapsed_time:.2f}s")
+            self.logger.info("Document analysis completed in {:.2f}s", elapsed_time)
             self.logger.debug(
-                f"Extracted PRD: {prd.title} with {len(features)} features"
+                "Extracted PRD: {} with {} features", prd.title, len(features)
+            )
+            # Lazy so the per-feature summary is only built when DEBUG is enabled
+            self.logger.opt(lazy=True).debug(
+                "{}",
+                lambda: "\n".join(
+                    f"Feature {i + 1}: {feature.name} with "
+                    f"{len(feature.requirements)} requirements"
+                    for i, feature in enumerate(features)
+                ),
             )
 
-            for i, feature in enumerate(features):
-                self.logger.debug(
-                    f"Feature {i + 1}: {feature.name} with {len(feature.requirements)} requirements"
-                )
+            if cache_key:
+                self._analysis_cache[cache_key] = self._copy_result(result)
+                if len(self._analysis_cache) > self._cache_size:
+                    self._analysis_cache.popitem(last=False)
 
             return result
         except Exception as e:
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             self.logger.error(
                 f"Error analyzing document after {elapsed_time:.2f}s: {str(e)}"
             )
             raise
 
+    def _get_cache_key(
+        self, document_path: str, kwargs: dict[str, Any], stat: os.stat_result
+    ) -> tuple[Any, ...] | None:
+        """Builds the analysis cache key for a document.
+
+        The key combines the absolute path with the file's modification time
+        and size, so edits to the document invalidate earlier results.
+
+        Args:
+            document_path: Path to the PRD document
+            kwargs: Additional parameters passed to execute
+            stat: Result of stat() on the document
+
+        Returns:
+            The cache key, or None if caching is disabled or not possible
+        """
+        if self._cache_size <= 0:
+            return None
+
+        key = (
+            os.path.abspath(document_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            tuple(sorted(kwargs.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def _copy_result(
+        result: tuple[PRD, Sequence[Feature]],
+    ) -> tuple[PRD, list[Feature]]:
+        """Returns a deep copy of an analysis result so callers can mutate it."""
+        prd, features = result
+        return deepcopy(prd), [deepcopy(f) for f in features]
+
     async def _analyze_markdown(
         self, document_path: str, **kwargs: Any
-    ) -> tuple[PRD, list[Feature]]:
+    ) -> tuple[PRD, Sequence[Feature]]:
         """Analyzes a Markdown PRD.
 
         Args:
@@ -108,17 +644,75 @@ class DocumentAnalysisAgent(Agent):
         Returns:
             Tuple of PRD and extracted features
         """
-        self.logger.debug(f"Reading Markdown content from {document_path}")
+        self.logger.debug("Reading Markdown content from {}", document_path)
 
-        # Read document
+        # Read document without blocking the event loop
         try:
-            with open(document_path, encoding="utf-8") as f:
-                content = f.read()
-            self.logger.debug(f"Read {len(content)} bytes from document")
+            content = await asyncio.to_thread(self._read_document, document_path)
+            self.logger.debug("Read {} bytes from document", len(content))
         except Exception as e:
             self.logger.error(f"Error reading Markdown file: {str(e)}")
             raise
 
+        # Parsing is CPU-bound, so keep it off the event loop
+        return await asyncio.to_thread(
+            self._parse_markdown, content, document_path, **kwargs
+        )
+
+    @staticmethod
+    def _read_document(document_path: str) -> str:
+        """Reads a UTF-8 document with a single unbuffered read.
+
+        The file is read straight into a buffer sized from fstat, bypassing the
+        buffered and text I/O layers. Large files are memory-mapped and decoded
+        straight from the page cache instead. Line endings are normalized the
+        same way text mode would, while decoding.
+
+        Args:
+            document_path: Path to the document
+
+        Returns:
+            Decoded document content
+        """
+        with open(document_path, "rb", buffering=0) as file:
+            size = os.fstat(file.fileno()).st_size
+            if size >= _MMAP_THRESHOLD:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if mapped.find(b"\r") >= 0:
+                        content = _decode_translating_newlines(mapped)
+                    else:
+                        content = str(mapped, "utf-8")
+            else:
+                buffer = bytearray(size)
+                view = memoryview(buffer)
+                read = 0
+                while read < size:
+                    chunk = file.readinto(view[read:])
+                    if not chunk:
+                        break
+                    read += chunk
+                view.release()
+                del buffer[read:]
+                if b"\r" in buffer:
+                    content = _decode_translating_newlines(buffer)
+                else:
+                    content = buffer.decode("utf-8")
+
+        return content
+
+    def _parse_markdown(
+        self, content: str, document_path: str, **kwargs: Any
+    ) -> tuple[PRD, Sequence[Feature]]:
+        """Parses Markdown content with the best available parser.
+
+        Args:
+            content: Markdown content of the document
+            document_path: Path to the Markdown document
+            **kwargs: Additional parameters
+
+        Returns:
+            Tuple of PRD and extracted features
+        """
         # Use enhanced parsing if available
         if ENHANCED_PARSING_AVAILABLE:
             return self._analyze_markdown_enhanced(content, document_path, **kwargs)
@@ -126,7 +720,7 @@ class DocumentAnalysisAgent(Agent):
             # Fall back to basic parsing
             return self._analyze_markdown_basic(content, document_path, **kwargs)
 
-    def _analyze_markdown_enhanced(self, content: str, document_path: str, **kwargs: Any) -> tuple[PRD, list[Feature]]:
+    def _analyze_markdown_enhanced(self, content: str, document_path: str, **kwargs: Any) -> tuple[PRD, Sequence[Feature]]:
         """Enhanced markdown analysis with frontmatter, tables, and advanced parsing."""
         try:
             # Parse frontmatter
@@ -134,24 +728,27 @@ class DocumentAnalysisAgent(Agent):
             frontmatter_data = post.metadata
             markdown_content = post.content
 
-            # Initialize markdown parser with plugins
-            md = MarkdownIt("commonmark", {"breaks": True, "html": True})
-            md.use(front_matter_plugin)
-            md.use(tasklists_plugin)
-
             # Parse markdown into tokens
-            tokens = md.parse(markdown_content)
+            if self._md is None:
+                raise RuntimeError("Enhanced Markdown parser is not available")
+            tokens = self._md.parse(markdown_content)
+            sections = _split_sections(markdown_content)
 
             # Extract metadata with enhanced support
-            metadata = self._extract_enhanced_metadata(frontmatter_data, markdown_content)
-            title = metadata.get('title') or self._extract_title(markdown_content)
+            metadata = self._extract_enhanced_metadata(
+                frontmatter_data, markdown_content, sections
+            )
+            title = metadata.get('title') or self._extract_title(
+                markdown_content, sections
+            )
             version = metadata.get('version') or self._extract_version(markdown_content)
             author = metadata.get('author') or self._extract_author(markdown_content)
-            description = self._extract_description(markdown_content)
+            description = self._extract_description(markdown_content, sections)
 
             # Create PRD with metadata
-            created_at = kwargs.get("created_at", datetime.now())
-            updated_at = kwargs.get("updated_at", datetime.now())
+            now = datetime.now()
+            created_at = kwargs.get("created_at", now)
+            updated_at = kwargs.get("updated_at", now)
 
             prd = PRD(
                 id=Path(document_path).stem,
@@ -165,13 +762,19 @@ class DocumentAnalysisAgent(Agent):
             )
 
             # Extract features with enhanced parsing
-            features = self._extract_features_enhanced(tokens, markdown_content)
+            lazy = kwargs.get("lazy", False)
+            features = self._extract_features_enhanced(
+                tokens, markdown_content, sections, lazy=lazy
+            )
 
-            # Generate dependency graph
-            prd.dependency_graph = self._generate_dependency_graph(features)
+            # Generate dependency graph, which needs every feature parsed
+            if not lazy:
+                prd.dependency_graph = self._generate_dependency_graph(features)
 
             self.logger.info(
-                f"Enhanced markdown analysis complete: {prd.title} with {len(features)} features"
+                "Enhanced markdown analysis complete: {} with {} features",
+                prd.title,
+                len(features),
             )
             return prd, features
 
@@ -179,17 +782,21 @@ class DocumentAnalysisAgent(Agent):
             self.logger.warning(f"Enhanced parsing failed, falling back to basic: {e}")
             return self._analyze_markdown_basic(content, document_path, **kwargs)
 
-    def _analyze_markdown_basic(self, content: str, document_path: str, **kwargs: Any) -> tuple[PRD, list[Feature]]:
+    def _analyze_markdown_basic(self, content: str, document_path: str, **kwargs: Any) -> tuple[PRD, Sequence[Feature]]:
         """Basic markdown analysis (original implementation)."""
+        # Index the headings once for all extractors
+        sections = _split_sections(content)
+
         # Extract metadata
-        title = self._extract_title(content)
+        title = self._extract_title(content, sections)
         version = self._extract_version(content)
         author = self._extract_author(content)
-        description = self._extract_description(content)
+        description = self._extract_description(content, sections)
 
         # Create PRD
-        created_at = kwargs.get("created_at", datetime.now())
-        updated_at = kwargs.get("updated_at", datetime.now())
+        now = datetime.now()
+        created_at = kwargs.get("created_at", now)
+        updated_at = kwargs.get("updated_at", now)
 
         prd = PRD(
             id=Path(document_path).stem,
@@ -202,246 +809,244 @@ class DocumentAnalysisAgent(Agent):
         )
 
         # Extract features
-        features = self._extract_features(content)
+        features = (
+            self._extract_features_lazily(content, sections)
+            if kwargs.get("lazy")
+            else self._extract_features(content, sections)
+        )
 
         self.logger.info(
-            f"Markdown analysis complete: {prd.title} with {len(features)} features"
+            "Markdown analysis complete: {} with {} features", prd.title, len(features)
         )
         return prd, features
 
-    def _extract_title(self, content: str) -> str:
+    def _extract_title(
+        self, content: str, sections: list[_Section] | None = None
+    ) -> str:
         """Extract title from markdown content."""
-        # Try multiple patterns for title
-        patterns = [
-            r"^#\s+Product Requirements Document:\s*(.+)$",
-            r"^#\s+PRD:\s*(.+)$",
-            r"^#\s+(.+?)(?:\s*\n|$)",  # Any H1 heading
+        if sections is None:
+            sections = _split_sections(content)
+        headings = [
+            section.title for section in sections if section.level == 1 and section.title
         ]
+        if not headings:
+            return "Unknown PRD"
 
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE)
+        # Prefer a prefixed title, then fall back to the first H1 heading
+        title = headings[0]
+        for pattern in _TITLE_RES:
+            match = next(filter(None, map(pattern.match, headings)), None)
             if match:
                 title = match.group(1).strip()
-                # Remove trailing colons
-                if title.endswith(":"):
-                    title = title[:-1].strip()
-                return title
+                break
 
-        return "Unknown PRD"
+        # Remove trailing colons
+        if title.endswith(":"):
+            title = title[:-1].strip()
+        return title
 
     def _extract_version(self, content: str) -> str:
         """Extract version from markdown content."""
-        match = re.search(r"Version:\s*(\S+)", content, re.IGNORECASE)
+        match = _search_label(content, "version:", _VERSION_RE)
         return match.group(1) if match else "0.0.0"
 
     def _extract_author(self, content: str) -> str:
         """Extract author from markdown content."""
-        match = re.search(r"Author:\s*(.+?)(?:\n|$)", content, re.IGNORECASE)
+        match = _search_label(content, "author:", _AUTHOR_RE)
         return match.group(1).strip() if match else "Unknown"
 
-    def _extract_description(self, content: str) -> str:
+    def _extract_description(
+        self, content: str, sections: list[_Section] | None = None
+    ) -> str:
         """Extract description from overview/summary section."""
-        # Look for overview or executive summary sections
-        patterns = [
-            r"##\s+(?:Executive\s+)?Overview\s*\n+((?:(?!^#).*\n)*)",
-            r"##\s+Executive\s+Summary\s*\n+((?:(?!^#).*\n)*)",
-            r"##\s+(?:Project\s+)?Description\s*\n+((?:(?!^#).*\n)*)",
-        ]
+        if sections is None:
+            sections = _split_sections(content)
 
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE)
-            if match:
-                desc_text = match.group(1).strip()
+        # Look for overview or executive summary sections
+        for title_re in _DESCRIPTION_TITLE_RES:
+            for index, section in enumerate(sections):
+                if section.level < 2 or not title_re.fullmatch(section.title):
+                    continue
+                # The description stops at the next heading of any level
+                end = (
+                    sections[index + 1].offset
+                    if index + 1 < len(sections)
+                    else len(content)
+                )
+                desc_text = content[section.start : end].strip()
                 # Clean up the description
-                desc_lines = [
-                    line.strip() for line in desc_text.split("\n") if line.strip()
-                ]
-                return " ".join(desc_lines)
+                desc_lines = map(str.strip, desc_text.split("\n"))
+                return " ".join(filter(None, desc_lines))
 
         return ""
 
-    def _extract_features(self, content: str) -> list[Feature]:
+    def _extract_features(
+        self, content: str, sections: list[_Section] | None = None
+    ) -> list[Feature]:
         """Extract features from markdown content."""
-        features: list[Feature] = []
-
-        # Find features section
-        features_match = re.search(
-            r"##\s+Features?\s*\n(.*?)(?=^##\s|\Z)",
-            content,
-            re.MULTILINE | re.DOTALL | re.IGNORECASE,
-        )
-
-        if not features_match:
+        return _parse_all(self._extract_features_lazily(content, sections))
+
+    def _extract_features_lazily(
+        self, content: str, sections: list[_Section] | None = None
+    ) -> LazyFeatures:
+        """Find the feature sections; each feature is parsed on first access."""
+        # Find the ### feature sections inside the features section
+        if sections is None:
+            sections = _split_sections(content)
+        feature_sections = _find_subsections(sections, _FEATURES_TITLE_RE)
+
+        if feature_sections is None:
             self.logger.debug("No features section found in content")
-            return features
-
-        features_content = features_match.group(1)
-        self.logger.debug(f"Found features section with {len(features_content)} chars")
+            feature_sections = []
+        else:
+            self.logger.debug("Found {} feature sections", len(feature_sections))
 
-        # Extract individual features (### headings only, not #### or deeper)
-        # More flexible pattern to catch different feature formats
-        # Only capture ### headings (exactly 3 #s)
-        feature_pattern = (
-            r"^###\s+((?:Feature\s*\d+:?\s*)?(?:\d+\.\s*)?)?(.+?)\n(.*?)(?=^###\s|\Z)"
-        )
-        feature_matches = list(
-            re.finditer(feature_pattern, features_content, re.MULTILINE | re.DOTALL)
+        names = [self._clean_feature_name(section.title) for section in feature_sections]
+        return LazyFeatures(
+            names,
+            lambda i: self._build_feature(content, feature_sections[i], names[i], i),
         )
 
-        self.logger.debug(f"Found {len(feature_matches)} feature matches")
-
-        for i, match in enumerate(feature_matches):
-            # Group 1: optional prefix (e.g., "Feature 1:", "1.")
-            # Group 2: feature name
-            # Group 3: feature content
-            prefix = match.group(1) or ""
-            raw_name = match.group(2).strip()
-
-            # Check if we have a "Feature X:" pattern to remove
-            if prefix and "feature" in prefix.lower():
-                # Just use the name part after "Feature X:"
-                feature_name = raw_name
-            else:
-                # Keep the prefix (like "1. ")
-                feature_name = (prefix + raw_name).strip()
-
-            # Remove trailing colons from feature name
-            if feature_name.endswith(":"):
-                feature_name = feature_name[:-1].strip()
-
-            feature_content = match.group(3).strip()
-            self.logger.debug(
-                f"Feature content for '{feature_name}': {feature_content[:100]}..."
-            )
+    def _clean_feature_name(self, title: str) -> str:
+        """Derive a feature name from its heading title."""
+        # Split off an optional prefix (e.g., "Feature 1:", "1.")
+        prefix_match = _FEATURE_NAME_PREFIX_RE.match(title)
+        prefix_end = prefix_match.end() if prefix_match else 0
+        prefix = title[:prefix_end]
+        raw_name = title[prefix_end:].strip()
+        if not raw_name:
+            prefix, raw_name = "", title
+
+        # Check if we have a "Feature X:" pattern to remove
+        if prefix and "feature" in prefix.lower():
+            # Just use the name part after "Feature X:"
+            feature_name = raw_name
+        else:
+            # Keep the prefix (like "1. ")
+            feature_name = (prefix + raw_name).strip()
+
+        # Remove trailing colons from feature name
+        if feature_name.endswith(":"):
+            feature_name = feature_name[:-1].strip()
+
+        return feature_name
+
+    def _build_feature(
+        self, content: str, section: _Section, feature_name: str, i: int
+    ) -> Feature:
+        """Parse a feature section of the basic parser."""
+        feature_content = content[section.start : section.end].strip()
+        self.logger.debug(
+            "Feature content for '{}': {:.100}...", feature_name, feature_content
+        )
 
-            # Generate feature ID from name
-            feature_id = self._generate_feature_id(feature_name, i)
+        # Generate feature ID from name
+        feature_id = self._generate_feature_id(feature_name, i)
 
-            # Extract description (first paragraph or sentences before any subsection)
-            desc_lines: list[str] = []
-            for line in feature_content.split("\n"):
-                line = line.strip()
-                if not line:
-                    if desc_lines:  # Stop at first empty line after content
-                        break
-                    continue
-                if line.startswith(("**", "####", "-", "*")) or (
-                    line.endswith(":") and len(line) < 30
-                ):
-                    break
-                desc_lines.append(line)
-            description = " ".join(desc_lines)
-
-            # Extract requirements
-            self.logger.debug(
-                f"Extracting requirements from: {feature_content[:100]}..."
-            )
-            requirements = self._extract_requirements(feature_content)
+        # Extract description and requirements in one pass over the lines
+        self.logger.debug(
+            "Extracting requirements from: {:.100}...", feature_content
+        )
+        description, requirements = self._scan_feature_body(feature_content)
 
-            # Extract dependencies
-            dependencies = self._extract_dependencies(feature_content)
+        # Extract dependencies
+        dependencies = self._extract_dependencies(feature_content)
 
-            # Extract priority
-            priority = self._extract_priority(feature_content)
+        # Extract priority
+        priority = self._extract_priority(feature_content)
 
-            # Create feature
-            feature = Feature(
-                id=feature_id,
-                title=feature_name,
-                description=description,
-                requirements=requirements,
-                dependencies=dependencies,
-                priority=priority,
-                status=FeatureStatus.PROPOSED,
-            )
-
-            features.append(feature)
+        # Create feature
+        feature = Feature(
+            id=feature_id,
+            title=feature_name,
+            description=description,
+            requirements=requirements,
+            dependencies=dependencies,
+            priority=priority,
+            status=FeatureStatus.PROPOSED,
+        )
 
-        return features
+        return feature
 
     def _generate_feature_id(self, feature_name: str, index: int) -> str:
         """Generate a unique feature ID from the feature name."""
-        # Create slug from feature name
-        slug = feature_name.lower()
-        slug = re.sub(r"[^a-z0-9\s-]", "", slug)
-        slug = re.sub(r"\s+", "_", slug)
-        slug = slug.strip("_")
+        # Create slug from feature name: drop disallowed characters, then
+        # collapse whitespace runs into single underscores
+        slug = "_".join(feature_name.lower().translate(_SLUG_TABLE).split())
 
         # Add index to ensure uniqueness
         return f"{slug}_{index:02d}"
 
     def _extract_requirements(self, feature_content: str) -> list[str]:
         """Extract requirements from feature content."""
-        requirements = []
+        return self._scan_feature_body(feature_content)[1]
 
-        # Look for requirements section
-        req_match = re.search(
-            r"\*\*Requirements?:\*\*\s*\n(.*?)(?=\*\*|\n\n|$)",
-            feature_content,
-            re.DOTALL | re.IGNORECASE,
-        )
+    def _scan_feature_body(self, feature_content: str) -> tuple[str, list[str]]:
+        """Extract the description and requirements of a feature in one scan.
 
-        if req_match:
-            req_text = req_match.group(1)
-            self.logger.debug(f"Found requirements text: {req_text[:50]}...")
-            # Extract bullet points
-            req_pattern = r"[-*]\s+(?:REQ-\d+(?:\.\d+)?:\s+)?(.+?)(?=\n[-*]|\n\n|$)"
-            for match in re.finditer(req_pattern, req_text, re.MULTILINE):
-                req_item = match.group(1).strip()
-                requirements.append(req_item)
-                self.logger.debug(f"Extracted requirement: {req_item}")
-
-        # Also check for numbered requirements in subsections (#### headings)
-        subsection_pattern = r"####\s+\d+\.\d+\s+(.+?)\n(.*?)\*\*Requirements?:\*\*\s*\n(.*?)(?=####|\*\*|###|\Z)"
-        for match in re.finditer(
-            subsection_pattern, feature_content, re.DOTALL | re.IGNORECASE
-        ):
-            subsection_reqs = match.group(3)
-            self.logger.debug(
-                f"Found subsection requirements: {subsection_reqs[:50]}..."
-            )
-            req_pattern = r"[-*]\s+(?:REQ-\d+(?:\.\d+)?:\s+)?(.+?)(?=\n[-*]|\n\n|$)"
-            for req_match in re.finditer(req_pattern, subsection_reqs, re.MULTILINE):
-                req_item = req_match.group(1).strip()
-                requirements.append(req_item)
-                self.logger.debug(f"Extracted subsection requirement: {req_item}")
+        The description is the first paragraph, up to the first empty line,
+        bold label, bullet, subsection or short "Label:" line. Requirements are
+        the bullets of every "**Requirements:**" block, including the ones
+        nested in "#### N.M" subsections. A block ends at the next unindented
+        line that is not a bullet.
+        """
+        desc_lines: list[str] = []
+        in_description = True
+        requirements = []
+        in_block = False
+
+        for line in _iter_split(feature_content, "\n"):
+            if in_description:
+                text = line.strip()
+                if not text:
+                    # Stop at first empty line after content
+                    in_description = not desc_lines
+                elif text.startswith(("**", "####", "-", "*")) or (
+                    text.endswith(":") and len(text) < 30
+                ):
+                    in_description = False
+                else:
+                    desc_lines.append(text)
+
+            if line.rstrip(" \t").lower() in _REQUIREMENT_MARKERS:
+                in_block = True
+            elif (item := _bullet_text(line)) is not None:
+                if in_block:
+                    req_item = _strip_requirement_id(item)
+                    requirements.append(sys.intern(req_item))
+                    self.logger.debug("Extracted requirement: {}", req_item)
+            elif line[:1] and not line[0].isspace():
+                in_block = False
 
-        return requirements
+        return " ".join(desc_lines), requirements
 
     def _extract_dependencies(self, feature_content: str) -> list[str]:
         """Extract dependencies from feature content."""
         dependencies = []
 
         # Look for dependencies line
-        dep_match = re.search(
-            r"\*\*Dependencies?:\*\*\s*(.+?)(?=\n|$)", feature_content, re.IGNORECASE
-        )
+        dep_match = _DEPENDENCIES_FIELD_RE.search(feature_content)
 
         if dep_match:
             dep_text = dep_match.group(1).strip()
             # Split by comma and clean up
             deps = [d.strip() for d in dep_text.split(",")]
-            dependencies = [d for d in deps if d and d.lower() != "none"]
+            dependencies = [sys.intern(d) for d in deps if d and d.lower() != "none"]
 
         return dependencies
 
     def _extract_priority(self, feature_content: str) -> int:
         """Extract priority from feature content."""
         # Look for priority indication
-        priority_match = re.search(
-            r"\*\*Priority:\*\*\s*(.+?)(?=\n|$)", feature_content, re.IGNORECASE
-        )
+        priority_match = _PRIORITY_FIELD_RE.search(feature_content)
 
         if priority_match:
             priority_text = priority_match.group(1).strip().lower()
 
             # Map priority text to numbers
-            if "high" in priority_text or "p0" in priority_text:
-                return 0
-            elif "medium" in priority_text or "p1" in priority_text:
-                return 1
-            elif "low" in priority_text or "p2" in priority_text:
-                return 2
+            for priority, keywords in _PRIORITY_FIELD_KEYWORDS:
+                if any(keyword in priority_text for keyword in keywords):
+                    return priority
 
         return 0  # Default to high priority
 
@@ -479,13 +1084,18 @@ class DocumentAnalysisAgent(Agent):
         self.logger.warning("PDF document analysis is not yet implemented")
         raise NotImplementedError("PDF document analysis is not yet implemented")
 
-    def _extract_enhanced_metadata(self, frontmatter_data: dict[str, Any], content: str) -> dict[str, Any]:
+    def _extract_enhanced_metadata(
+        self,
+        frontmatter_data: dict[str, Any],
+        content: str,
+        sections: list[_Section] | None = None,
+    ) -> dict[str, Any]:
         """Extract metadata from frontmatter and content."""
         metadata = frontmatter_data.copy()
 
         # Extract additional metadata from content if not in frontmatter
         if 'title' not in metadata:
-            metadata['title'] = self._extract_title(content)
+            metadata['title'] = self._extract_title(content, sections)
         if 'version' not in metadata:
             metadata['version'] = self._extract_version(content)
         if 'author' not in metadata:
@@ -493,102 +1103,87 @@ class DocumentAnalysisAgent(Agent):
 
         return metadata
 
-    def _extract_features_enhanced(self, tokens: list, content: str) -> list[Feature]:
+    def _extract_features_enhanced(
+        self,
+        tokens: list,
+        content: str,
+        sections: list[_Section] | None = None,
+        lazy: bool = False,
+    ) -> Sequence[Feature]:
         """Extract features using enhanced parsing with tokens and advanced patterns."""
-        features = []
-
         # First try to extract from tables
         table_features = self._extract_features_from_tables(content)
-        features.extend(table_features)
+        if table_features:
+            return table_features
 
         # Then extract from sections if no table features found
-        if not table_features:
-            section_features = self._extract_features_from_sections(content)
-            features.extend(section_features)
-
-        return features
+        section_features = self._extract_section_features_lazily(content, sections)
+        return section_features if lazy else _parse_all(section_features)
 
     def _extract_features_from_tables(self, content: str) -> list[Feature]:
         """Extract features from markdown tables."""
-        features = []
-
-        # Find tables with feature information
-        table_pattern = r'\|[^|]*Feature[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^\n]*\n\|[-|\s]*\|\n((?:\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^\n]*\n)*)'
-
-        # Alternative pattern for requirement matrices
-        simple_table_pattern = r'\|\s*Feature[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^\n]*\n\|[-:\s|]*\n((?:\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^|]*\|[^\n]*\n)*)'
-
-        for pattern in [table_pattern, simple_table_pattern]:
-            matches = re.finditer(pattern, content, re.MULTILINE | re.IGNORECASE)
-
-            for match in matches:
-                table_content = match.group(1) if match.groups() else match.group(0)
-                rows = table_content.strip().split('\n')
-
-                for i, row in enumerate(rows):
-                    if row.strip().startswith('|'):
-                        cells = [cell.strip() for cell in row.split('|')[1:-1]]  # Remove empty first and last
-
-                        if len(cells) >= 6:  # Feature table format
-                            feature_id = cells[0].strip()
-                            feature_name = cells[1].strip()
-                            priority = cells[2].strip()
-                            effort = cells[3].strip()
-                            dependencies_str = cells[5].strip() if len(cells) > 5 else ""
-
-                            if feature_name and feature_name != 'Feature Name':
-                                dependencies = []
-                                if dependencies_str and dependencies_str.lower() not in ['none', '']:
-                                    dependencies = [dep.strip() for dep in dependencies_str.split(',')]
-
-                                feature = Feature(
-                                    id=feature_id or self._generate_feature_id(feature_name, i),
-                                    title=feature_name,
-                                    description="Feature extracted from requirements matrix",
-                                    priority=priority,
-                                    effort=effort,
-                                    dependencies=dependencies,
-                                    status=FeatureStatus.PROPOSED,
-                                )
-                                features.append(feature)
-
-        return features
-
-    def _extract_features_from_sections(self, content: str) -> list[Feature]:
-        """Extract features from markdown sections with enhanced parsing."""
         features: list[Feature] = []
 
-        # First, find the Features section
-        features_match = re.search(
-            r"##\s+(?:\d+\.\s*)?Features?\s*\n(.*?)(?=^##\s|\Z)",
-            content,
-            re.MULTILINE | re.DOTALL | re.IGNORECASE,
-        )
-
-        if not features_match:
-            self.logger.debug("No features section found in content")
+        # Most PRD templates have no tables at all; skip the table scans then
+        if "|" not in content:
             return features
 
-        features_content = features_match.group(1)
-
-        # Enhanced pattern to capture feature subsections within the Features section
-        # Look for ### headings (feature level) within the Features section
-        feature_pattern = r'(?:^|\n)###\s+(?:\d+\.?\d*\s+)?([^#\n]+?)(?:\s*\n|$)(.*?)(?=\n###\s|\n##\s|\Z)'
+        for i, cells in _iter_feature_table_rows(content):
+            if len(cells) >= 6:  # Feature table format
+                feature_id = cells[0]
+                feature_name = cells[1]
+                priority = cells[2]
+                effort = cells[3]
+                dependencies_str = cells[5]
+
+                if feature_name and feature_name != 'Feature Name':
+                    dependencies = []
+                    if dependencies_str and dependencies_str.lower() not in ['none', '']:
+                        dependencies = [dep.strip() for dep in dependencies_str.split(',')]
+
+                    feature = Feature(
+                        id=feature_id or self._generate_feature_id(feature_name, i),
+                        title=feature_name,
+                        description="Feature extracted from requirements matrix",
+                        priority=self._convert_priority_to_int(priority),
+                        effort=effort,
+                        dependencies=dependencies,
+                        status=FeatureStatus.PROPOSED,
+                    )
+                    features.append(feature)
 
-        matches = re.finditer(feature_pattern, features_content, re.MULTILINE | re.DOTALL)
+        return features
 
-        for i, match in enumerate(matches):
-            raw_title = match.group(1).strip()
-            feature_content = match.group(2).strip()
+    def _extract_features_from_sections(
+        self, content: str, sections: list[_Section] | None = None
+    ) -> list[Feature]:
+        """Extract features from markdown sections with enhanced parsing."""
+        return _parse_all(self._extract_section_features_lazily(content, sections))
+
+    def _extract_section_features_lazily(
+        self, content: str, sections: list[_Section] | None = None
+    ) -> LazyFeatures:
+        """Find the feature sections of the enhanced parser; see LazyFeatures."""
+        # Find the ### feature sections inside the Features section
+        if sections is None:
+            sections = _split_sections(content)
+        feature_sections = _find_subsections(sections, _NUMBERED_FEATURES_TITLE_RE)
+
+        if feature_sections is None:
+            self.logger.debug("No features section found in content")
+            feature_sections = []
 
-            # Clean up feature title - remove prefixes like "Feature 1:", "1.", etc.
-            feature_title = raw_title
+        # Sections kept as features, with their index and cleaned-up title
+        kept: list[tuple[int, _Section, str]] = []
+        for i, section in enumerate(feature_sections):
+            # Clean up feature title - remove prefixes like "2.1", "Feature 1:", etc.
+            feature_title = _NUMBERED_PREFIX_RE.sub('', section.title)
 
             # Remove "Feature X:" prefix
-            feature_title = re.sub(r'^Feature\s*\d*:\s*', '', feature_title, flags=re.IGNORECASE)
+            feature_title = _FEATURE_PREFIX_RE.sub('', feature_title)
 
             # Remove numbered prefix like "1.", "2.1", etc.
-            feature_title = re.sub(r'^\d+\.?\d*\s+', '', feature_title)
+            feature_title = _NUMBERED_PREFIX_RE.sub('', feature_title)
 
             feature_title = feature_title.strip()
 
@@ -597,107 +1192,110 @@ class DocumentAnalysisAgent(Agent):
                    ['overview', 'introduction', 'background', 'conclusion', 'appendix']):
                 continue
 
-            # Extract priority and effort from title or content
-            priority_str = self._extract_priority_from_text(f"{feature_title}\n{feature_content}")
-            # Convert string priority to integer for backward compatibility
-            priority = self._convert_priority_to_int(priority_str)
-            effort = self._extract_effort_from_text(f"{feature_title}\n{feature_content}")
+            kept.append((i, section, feature_title))
 
-            # Extract description
-            description = self._extract_feature_description(feature_content)
-
-            # Extract user stories
-            user_stories = self._extract_user_stories(feature_content)
+        return LazyFeatures(
+            [feature_title for _, _, feature_title in kept],
+            lambda n: self._build_section_feature(content, *kept[n]),
+        )
 
-            # Extract acceptance criteria
-            acceptance_criteria = self._extract_acceptance_criteria(feature_content)
+    def _build_section_feature(
+        self, content: str, i: int, section: _Section, feature_title: str
+    ) -> Feature:
+        """Parse a feature section of the enhanced parser."""
+        feature_content = content[section.start : section.end].strip()
+
+        # Extract priority and effort from title or content
+        priority_str = self._extract_priority_from_text(f"{feature_title}\n{feature_content}")
+        # Convert string priority to integer for backward compatibility
+        priority = self._convert_priority_to_int(priority_str)
+        effort = self._extract_effort_from_text(f"{feature_title}\n{feature_content}")
+
+        # Extract description
+        description = self._extract_feature_description(feature_content)
+
+        # Skip the extractors for parts this feature cannot contain
+        hints = _scan_feature_hints(feature_content)
+
+        # Extract user stories
+        user_stories = (
+            self._extract_user_stories(feature_content)
+            if hints.user_stories
+            else []
+        )
 
-            # Extract definition of done
-            definition_of_done = self._extract_definition_of_done(feature_content)
+        # Extract acceptance criteria
+        acceptance_criteria = (
+            self._extract_acceptance_criteria(feature_content)
+            if hints.acceptance_criteria
+            else []
+        )
 
-            # Extract requirements
-            requirements = self._extract_requirements(feature_content)
+        # Extract definition of done
+        definition_of_done = (
+            self._extract_definition_of_done(feature_content)
+            if hints.definition_of_done
+            else []
+        )
 
-            # Extract dependencies
-            dependencies = self._extract_dependencies_enhanced(feature_content)
+        # Extract requirements
+        requirements = (
+            self._extract_requirements(feature_content)
+            if hints.requirements
+            else []
+        )
 
-            # Create feature with enhanced data
-            feature = Feature(
-                id=self._generate_feature_id(feature_title, i),
-                title=feature_title,
-                description=description,
-                priority=priority,  # Already converted to int for compatibility
-                effort=effort,
-                requirements=requirements,
-                dependencies=dependencies,
-                user_stories=user_stories,
-                acceptance_criteria=acceptance_criteria,
-                definition_of_done=definition_of_done,
-                status=FeatureStatus.PROPOSED,
-            )
+        # Extract dependencies
+        dependencies = (
+            self._extract_dependencies_enhanced(feature_content)
+            if hints.dependencies
+            else []
+        )
 
-            features.append(feature)
+        # Create feature with enhanced data
+        feature = Feature(
+            id=self._generate_feature_id(feature_title, i),
+            title=feature_title,
+            description=description,
+            priority=priority,  # Already converted to int for compatibility
+            effort=effort,
+            requirements=requirements,
+            dependencies=dependencies,
+            user_stories=user_stories,
+            acceptance_criteria=acceptance_criteria,
+            definition_of_done=definition_of_done,
+            status=FeatureStatus.PROPOSED,
+        )
 
-        return features
+        return feature
 
     def _extract_priority_from_text(self, text: str) -> str:
         """Extract priority from text using various patterns."""
-        # Priority patterns
-        priority_patterns = [
-            r'\*\*Priority\*\*:\s*(\w+)',
-            r'Priority:\s*(\w+)',
-            r'\*\*(\w+)\s+priority\*\*',
-            r'(\w+)\s+priority',
-            r'priority\s*[:\-]\s*(\w+)',
-        ]
-
-        for pattern in priority_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                priority = match.group(1).strip().title()
-                if priority in ['High', 'Medium', 'Low', 'Critical', 'Must', 'Should', 'Could']:
-                    return priority
+        text_lower = text.lower()
+        # Every hint pattern needs the word "priority"
+        if "priority" in text_lower:
+            for pattern in _PRIORITY_TEXT_RES:
+                match = pattern.search(text)
+                if match:
+                    priority = match.group(1).strip().title()
+                    if priority in _PRIORITY_LABELS:
+                        return priority
 
         # Natural language priority detection
-        text_lower = text.lower()
-        if any(word in text_lower for word in ['critical', 'must have', 'high priority']):
-            return 'High'
-        elif any(word in text_lower for word in ['should have', 'medium priority']):
-            return 'Medium'
-        elif any(word in text_lower for word in ['could have', 'low priority', 'nice to have']):
-            return 'Low'
+        for label, phrases in _PRIORITY_PHRASES:
+            if any(phrase in text_lower for phrase in phrases):
+                return label
 
         return 'Medium'  # Default
 
     def _convert_priority_to_int(self, priority_str: str) -> int:
         """Convert string priority to integer for backward compatibility."""
-        priority_map = {
-            'High': 0,
-            'Critical': 0,
-            'Must Have': 0,
-            'Must': 0,
-            'Medium': 1,
-            'Should Have': 1,
-            'Should': 1,
-            'Low': 2,
-            'Could Have': 2,
-            'Could': 2
-        }
-        return priority_map.get(priority_str, 0)  # Default to high (0)
+        return _PRIORITY_MAP.get(priority_str, 0)  # Default to high (0)
 
     def _extract_effort_from_text(self, text: str) -> str | None:
         """Extract effort estimation from text."""
-        effort_patterns = [
-            r'\*\*Effort\*\*:\s*(\d+\s*(?:SP|story points?|weeks?|days?))',
-            r'Effort:\s*(\d+\s*(?:SP|story points?|weeks?|days?))',
-            r'(\d+)\s*story\s*points?',
-            r'(\d+)\s*SP\b',
-            r'(\d+)\s*weeks?',
-            r'(\d+)\s*days?',
-        ]
-
-        for pattern in effort_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _EFFORT_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
@@ -706,18 +1304,13 @@ class DocumentAnalysisAgent(Agent):
     def _extract_feature_description(self, content: str) -> str:
         """Extract feature description from content."""
         # Look for description section
-        desc_patterns = [
-            r'(?:^|\n)#+\s*Description\s*\n(.*?)(?=\n#+|\n\*\*|\Z)',
-            r'(?:^|\n)\*\*Description\*\*[:\s]*\n(.*?)(?=\n\*\*|\n#+|\Z)',
-        ]
-
-        for pattern in desc_patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.DOTALL | re.IGNORECASE)
+        for pattern in _FEATURE_DESCRIPTION_RES:
+            match = pattern.search(content)
             if match:
                 return match.group(1).strip()
 
         # Fall back to first paragraph
-        paragraphs = content.split('\n\n')
+        paragraphs = _iter_split(content, '\n\n')
         for paragraph in paragraphs:
             if paragraph.strip() and not paragraph.strip().startswith('#'):
                 return paragraph.strip()
@@ -727,18 +1320,20 @@ class DocumentAnalysisAgent(Agent):
     def _extract_user_stories(self, content: str) -> list[UserStory]:
         """Extract user stories from content in multiple formats."""
         user_stories = []
+        # Story texts collected so far, so simple stories skip duplicates
+        seen: set[str] = set()
 
         # Pattern for "As a ... I want ... so that ..." format
-        as_a_pattern = r'(?:^|\n)[\s*-]*As\s+(?:a|an)\s+([^,]+),\s*I\s+want\s+([^,]+),?\s*so\s+that\s+(.+?)(?=\n|$)'
-
-        matches = re.finditer(as_a_pattern, content, re.MULTILINE | re.IGNORECASE)
+        matches = _AS_A_STORY_RE.finditer(content)
         for match in matches:
             actor = match.group(1).strip()
             action = match.group(2).strip()
             benefit = match.group(3).strip()
+            story_text = match.group(0).strip()
+            seen.add(story_text)
 
             user_stories.append(UserStory(
-                story=match.group(0).strip(),
+                story=story_text,
                 format="as_a_user",
                 actor=actor,
                 action=action,
@@ -746,22 +1341,21 @@ class DocumentAnalysisAgent(Agent):
             ))
 
         # Pattern for "Given ... When ... Then ..." format
-        gwt_pattern = r'(?:^|\n)[\s*-]*Given\s+([^,]+),?\s*When\s+([^,]+),?\s*Then\s+(.+?)(?=\n|$)'
-
-        matches = re.finditer(gwt_pattern, content, re.MULTILINE | re.IGNORECASE)
+        matches = _GIVEN_WHEN_THEN_STORY_RE.finditer(content)
         for match in matches:
+            story_text = match.group(0).strip()
+            seen.add(story_text)
             user_stories.append(UserStory(
-                story=match.group(0).strip(),
+                story=story_text,
                 format="given_when_then"
             ))
 
         # Pattern for simple user stories
-        simple_pattern = r'(?:^|\n)[\s*-]+(User|System|Admin).+?(?=\n|$)'
-
-        matches = re.finditer(simple_pattern, content, re.MULTILINE | re.IGNORECASE)
+        matches = _SIMPLE_STORY_RE.finditer(content)
         for match in matches:
             story_text = match.group(0).strip()
-            if not any(existing.story == story_text for existing in user_stories):
+            if story_text not in seen:
+                seen.add(story_text)
                 user_stories.append(UserStory(
                     story=story_text,
                     format="simple"
@@ -771,54 +1365,52 @@ class DocumentAnalysisAgent(Agent):
 
     def _extract_acceptance_criteria(self, content: str) -> list[str]:
         """Extract acceptance criteria from content."""
-        criteria = []
+        criteria: list[str] = []
 
         # Look for acceptance criteria section
-        ac_pattern = r'(?:^|\n)#+\s*Acceptance\s+Criteria\s*\n(.*?)(?=\n#+|\n\*\*|\Z)'
-
-        match = re.search(ac_pattern, content, re.MULTILINE | re.DOTALL | re.IGNORECASE)
+        match = _ACCEPTANCE_CRITERIA_RE.search(content)
         if match:
             ac_content = match.group(1).strip()
 
             # Extract numbered or bulleted criteria
-            criteria_lines = re.findall(r'(?:^|\n)[\s]*(?:\d+\.|\-|\*)\s*(.+?)(?=\n|$)', ac_content, re.MULTILINE)
-            criteria.extend([line.strip() for line in criteria_lines if line.strip()])
+            criteria_lines = _CRITERIA_ITEM_RE.findall(ac_content)
+            criteria.extend(filter(None, map(str.strip, criteria_lines)))
 
         return criteria
 
     def _extract_definition_of_done(self, content: str) -> list[str]:
         """Extract definition of done from content."""
-        dod_items = []
+        dod_items: list[str] = []
 
         # Look for definition of done section
-        dod_pattern = r'(?:^|\n)#+\s*Definition\s+of\s+Done\s*\n(.*?)(?=\n#+|\n\*\*|\Z)'
-
-        match = re.search(dod_pattern, content, re.MULTILINE | re.DOTALL | re.IGNORECASE)
+        match = _DEFINITION_OF_DONE_RE.search(content)
         if match:
             dod_content = match.group(1).strip()
 
             # Extract checklist items
-            dod_lines = re.findall(r'(?:^|\n)[\s]*(?:-\s*\[\s*\]|\-|\*)\s*(.+?)(?=\n|$)', dod_content, re.MULTILINE)
-            dod_items.extend([line.strip() for line in dod_lines if line.strip()])
+            dod_lines = _DOD_ITEM_RE.findall(dod_content)
+            dod_items.extend(filter(None, map(str.strip, dod_lines)))
 
         return dod_items
 
     def _extract_dependencies_enhanced(self, content: str) -> list[str]:
         """Extract dependencies with enhanced parsing."""
-        dependencies = []
-
-        # Look for dependencies section
-        dep_patterns = [
-            r'(?:^|\n)#+\s*Dependencies\s*\n(.*?)(?=\n#+|\n\*\*|\Z)',
-            r'(?:^|\n)\*\*Dependencies\*\*[:\s]*\n?(.*?)(?=\n\*\*|\n#+|\Z)',
-            r'\*\*Dependencies\*\*:\s*(.+?)(?=\n|$)',
-            r'Dependencies:\s*(.+?)(?=\n|$)',
-        ]
-
-        for pattern in dep_patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.DOTALL | re.IGNORECASE)
-            if match:
-                dep_content = match.group(1).strip()
+        dependencies: list[str] = []
+        # Dependencies collected so far, so duplicates are skipped in order
+        seen: set[str] = set()
+
+        # Look for dependencies sections, keeping the first one of each form
+        sections: dict[str, str] = {}
+        for match in _DEPENDENCY_SECTION_RE.finditer(content):
+            for form, section in match.groupdict().items():
+                if section is not None:
+                    sections.setdefault(form.removeprefix("leading_"), section)
+            if len(sections) == len(_DEPENDENCY_SECTION_FORMS):
+                break
+
+        for form in _DEPENDENCY_SECTION_FORMS:
+            if form in sections:
+                dep_content = sections[form].strip()
 
                 # Extract dependency references
                 if dep_content.lower() == 'none':
@@ -830,47 +1422,52 @@ class DocumentAnalysisAgent(Agent):
                     inline_deps = [dep.strip() for dep in dep_content.split(',')]
                     for dep in inline_deps:
                         if dep and dep.lower() != 'none':
-                            # Remove parenthetical references like "(2.1)"
-                            clean_dep = re.sub(r'\s*\([^)]*\)\s*', '', dep)
-                            clean_dep = ' '.join(clean_dep.split())
-                            if clean_dep:
-                                dependencies.append(clean_dep)
+                            clean_dep = _clean_dependency(dep)
+                            if clean_dep and clean_dep not in seen:
+                                seen.add(clean_dep)
+                                dependencies.append(sys.intern(clean_dep))
                 else:
                     # Parse bullet point format
-                    dep_lines = re.findall(r'(?:^|\n)[\s]*(?:\-|\*)\s*(.+?)(?=\n|$)', dep_content, re.MULTILINE)
-                    for line in dep_lines:
-                        if line.strip():
-                            # Clean up the line and extract the main dependency name
-                            clean_line = line.strip()
-                            # Remove bullet point prefixes that might have been missed
-                            clean_line = re.sub(r'^[\-\*\+]\s*', '', clean_line)
-                            # Remove parenthetical references like "(2.1)"
-                            clean_line = re.sub(r'\s*\([^)]*\)\s*', '', clean_line)
-                            # Remove extra whitespace
-                            clean_line = ' '.join(clean_line.split())
-                            if clean_line and clean_line.lower() != 'none':
-                                dependencies.append(clean_line)
+                    dep_lines = _DEPENDENCY_ITEM_RE.findall(dep_content)
+                    # Clean up each line and extract the main dependency name
+                    for clean_line in filter(None, map(str.strip, dep_lines)):
+                        # Remove bullet point prefixes that might have been missed
+                        if clean_line.startswith(("-", "*", "+")):
+                            clean_line = clean_line[1:]
+                        clean_line = _clean_dependency(clean_line)
+                        if (
+                            clean_line
+                            and clean_line.lower() != 'none'
+                            and clean_line not in seen
+                        ):
+                            seen.add(clean_line)
+                            dependencies.append(sys.intern(clean_line))
 
                 # Don't extract inline references for enhanced parsing - they're already included above
                 # inline_deps = re.findall(r'([A-Z]+-\d+|\d+\.\d+)', dep_content)
                 # dependencies.extend(inline_deps)
 
-        return list(set(dependencies))  # Remove duplicates
+        return dependencies
 
-    def _generate_dependency_graph(self, features: list[Feature]) -> dict[str, list[str]]:
+    def _generate_dependency_graph(self, features: Sequence[Feature]) -> dict[str, list[str]]:
         """Generate dependency graph from features."""
         graph: dict[str, list[str]] = {}
 
+        # Column views of the candidates, so the inner loop reads flat lists
+        # instead of model attributes and lowercases each title only once
+        candidate_ids = [feature.id for feature in features]
+        candidate_titles = [feature.title.lower() for feature in features]
+
         for feature in features:
             feature_id = feature.id
             graph[feature_id] = []
 
             for dependency in feature.dependencies:
+                dependency_lower = dependency.lower()
                 # Find the feature ID for this dependency
-                for dep_feature in features:
-                    if (dependency.lower() in dep_feature.title.lower() or
-                        dependency == dep_feature.id):
-                        graph[feature_id].append(dep_feature.id)
+                for dep_id, dep_title in zip(candidate_ids, candidate_titles, strict=True):
+                    if dependency_lower in dep_title or dependency == dep_id:
+                        graph[feature_id].append(dep_id)
                         break
 
         return graph
@@ -1,6 +1,8 @@
 """Agent for planning task sequences."""
 
+from collections.abc import Iterable
 from datetime import datetime
+from itertools import count
 from typing import Any
 
 from marvin.core.agents.base import Agent
@@ -10,6 +12,8 @@ from marvin.core.domain.models import PRD, Codebase, Feature, Task, TaskStatus,
 class DependencyGraph:
     """Graph for representing dependencies between tasks."""
 
+    __slots__ = ("nodes",)
+
     def __init__(self):
         """Initializes a new dependency graph."""
         self.nodes: dict[str, set[str]] = {}  # Feature ID -> dependent features
@@ -34,35 +38,110 @@ class DependencyGraph:
         self.add_node(to_id)
         self.nodes[from_id].add(to_id)
 
-    def has_cycle(self) -> bool:
-        """Checks if the graph contains cycles.
+    def copy(self) -> "DependencyGraph":
+        """Copies the graph.
+
+        Feature IDs are immutable strings, so only the edge sets are copied.
 
         Returns:
-            True if cycles are present, False otherwise
+            A graph with the same nodes and edges
         """
-        visited = set()
-        rec_stack = set()
+        graph = DependencyGraph()
+        graph.nodes = {
+            feature_id: set(to_ids) for feature_id, to_ids in self.nodes.items()
+        }
+        return graph
+
+    def strongly_connected_components(
+        self, restrict: Iterable[str] | None = None
+    ) -> list[list[str]]:
+        """Finds the strongly connected components of the graph.
 
-        def is_cyclic(node: str) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
+        Uses an iterative form of Pearce's variant of Tarjan's algorithm, so
+        deep dependency chains cannot exceed the recursion limit, and a
+        single rank per node takes the place of Tarjan's index and lowlink.
 
-            for neighbor in self.nodes[node]:
-                if neighbor not in visited:
-                    if is_cyclic(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
+        Args:
+            restrict: Only consider these nodes and the edges between them
+
+        Returns:
+            Components in reverse topological order: each one comes after
+            every component it depends on. A component lists its root first.
+        """
+        names = list(self.nodes if restrict is None else restrict)
+        number = {name: n for n, name in enumerate(names)}
+        # 0 marks unvisited nodes; finished components count down from the
+        # node count, so they always rank above the nodes still being visited
+        rank = [0] * len(names)
+        is_root = [False] * len(names)
+        next_rank = 1
+        component_rank = len(names)
+        pending: list[int] = []
+        components: list[list[str]] = []
+
+        for start in range(len(names)):
+            if rank[start]:
+                continue
+            rank[start] = next_rank
+            next_rank += 1
+            is_root[start] = True
+            stack = [(start, iter(self.nodes[names[start]]))]
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor_name in neighbors:
+                    neighbor = number.get(neighbor_name)
+                    if neighbor is None:
+                        continue
+                    if not rank[neighbor]:
+                        rank[neighbor] = next_rank
+                        next_rank += 1
+                        is_root[neighbor] = True
+                        stack.append((neighbor, iter(self.nodes[neighbor_name])))
+                        break
+                    if rank[neighbor] < rank[node]:
+                        rank[node] = rank[neighbor]
+                        is_root[node] = False
+                else:
+                    stack.pop()
+                    if is_root[node]:
+                        next_rank -= 1
+                        component = [names[node]]
+                        while pending and rank[node] <= rank[pending[-1]]:
+                            member = pending.pop()
+                            rank[member] = component_rank
+                            next_rank -= 1
+                            component.append(names[member])
+                        rank[node] = component_rank
+                        component_rank -= 1
+                        components.append(component)
+                    else:
+                        pending.append(node)
+                    if stack:
+                        parent = stack[-1][0]
+                        if rank[node] < rank[parent]:
+                            rank[parent] = rank[node]
+                            is_root[parent] = False
+
+        return components
+
+    def is_cycle(self, component: list[str]) -> bool:
+        """Checks if a strongly connected component is a cycle.
+
+        Args:
+            component: Component returned by strongly_connected_components
 
-            rec_stack.remove(node)
-            return False
+        Returns:
+            True if the component has several nodes or depends on itself
+        """
+        return len(component) > 1 or component[0] in self.nodes[component[0]]
 
-        for node in self.nodes:
-            if node not in visited:
-                if is_cyclic(node):
-                    return True
+    def has_cycle(self) -> bool:
+        """Checks if the graph contains cycles.
 
-        return False
+        Returns:
+            True if cycles are present, False otherwise
+        """
+        return any(map(self.is_cycle, self.strongly_connected_components()))
 
     def topological_sort(self) -> list[str]:
         """Performs a topological sort of the graph.
@@ -73,26 +152,11 @@ class DependencyGraph:
         Raises:
             ValueError: If the graph contains cycles
         """
-        if self.has_cycle():
+        components = self.strongly_connected_components()
+        if any(map(self.is_cycle, components)):
             raise ValueError("Graph contains cycles and cannot be topologically sorted")
 
-        visited = set()
-        result = []
-
-        def dfs(node: str) -> None:
-            visited.add(node)
-
-            for neighbor in self.nodes[node]:
-                if neighbor not in visited:
-                    dfs(neighbor)
-
-            result.append(node)
-
-        for node in self.nodes:
-            if node not in visited:
-                dfs(node)
-
-        return list(reversed(result))
+        return [component[0] for component in reversed(components)]
 
 
 class SequencePlannerAgent(Agent):
@@ -134,47 +198,54 @@ class SequencePlannerAgent(Agent):
                 prd.features, dependency_graph
             )
 
-        # Create workflow
+        # Create workflow; it and its tasks share one creation timestamp
+        now = datetime.now()
         workflow = Workflow(
             id=f"workflow_{prd.id}",
             name=f"Workflow for {prd.title}",
             description=f"Automatically generated workflow for {prd.title}",
             prd_id=prd.id,
             codebase_id=codebase.id if codebase else None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
 
-        # Create tasks for each feature
-        sequence_number = 1
+        # Index the features by ID; the first feature wins on duplicate IDs
+        feature_by_id: dict[str, Feature] = {}
+        for f in prd.features:
+            feature_by_id.setdefault(f.id, f)
+
+        # Create tasks for each feature, numbering only the ones created
+        sequence_numbers = count(1)
+        tasks: list[Task] = []
         for feature_id in feature_sequence:
-            feature = next((f for f in prd.features if f.id == feature_id), None)
+            feature = feature_by_id.get(feature_id)
             if not feature:
                 continue
 
             # Determine dependencies for the task
-            depends_on = []
-            for dep_id in feature.dependencies:
-                dep_feature = next((f for f in prd.features if f.id == dep_id), None)
-                if dep_feature:
-                    depends_on.append(f"task_{dep_feature.id}")
+            depends_on = [
+                f"task_{dep_id}"
+                for dep_id in feature.dependencies
+                if dep_id in feature_by_id
+            ]
 
             # Create task
             task = Task(
                 task_id=f"task_{feature.id}",
-                sequence_number=sequence_number,
+                sequence_number=next(sequence_numbers),
                 name=f"Implement {feature.name}",
                 description=feature.description,
                 feature_id=feature.id,
                 depends_on=depends_on,
                 status=TaskStatus.PLANNED,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
+                created_at=now,
+                updated_at=now,
             )
 
-            workflow.add_task(task)
-            sequence_number += 1
+            tasks.append(task)
 
+        workflow.add_tasks(tasks)
         return workflow
 
     async def _build_dependency_graph(self, features: list[Feature]) -> DependencyGraph:
@@ -211,38 +282,54 @@ class SequencePlannerAgent(Agent):
         Returns:
             Sequence of feature IDs
         """
-        # Create a deep copy of the graph
-        import copy
-
-        working_graph = copy.deepcopy(graph)
+        # Copy the edge sets, the only part of the graph that is modified
+        working_graph = graph.copy()
 
         # Consider feature priorities
         feature_priorities = {f.id: f.priority for f in features}
 
-        # Remove edges until no cycles remain
+        # Break each cycle at its lowest priority edge; removing an edge can
+        # only split its component, so only that component is searched again
         removed_edges = []
-        while working_graph.has_cycle():
-            # Find edge with lowest priority
-            min_priority = float("inf")
-            edge_to_remove = None
-
-            for from_id, to_ids in working_graph.nodes.items():
-                for to_id in to_ids:
-                    # Calculate edge priority
-                    edge_priority = feature_priorities.get(
-                        from_id, 0
-                    ) + feature_priorities.get(to_id, 0)
-                    if edge_priority < min_priority:
-                        min_priority = edge_priority
-                        edge_to_remove = (from_id, to_id)
-
-            if edge_to_remove:
-                from_id, to_id = edge_to_remove
-                working_graph.nodes[from_id].remove(to_id)
-                removed_edges.append(edge_to_remove)
-            else:
-                # No more edges to remove
-                break
+        cycles = [
+            component
+            for component in working_graph.strongly_connected_components()
+            if working_graph.is_cycle(component)
+        ]
+
+        # Weigh each edge inside a cycle once; the components searched later
+        # are parts of these, so their edges are all weighed here
+        edge_weights: dict[tuple[str, str], int] = {}
+        for component in cycles:
+            members = set(component)
+            for from_id in component:
+                from_priority = feature_priorities.get(from_id, 0)
+                for to_id in working_graph.nodes[from_id]:
+                    if to_id in members:
+                        edge_weights[from_id, to_id] = (
+                            from_priority + feature_priorities.get(to_id, 0)
+                        )
+
+        while cycles:
+            component = cycles.pop()
+            members = set(component)
+            edge_to_remove = min(
+                (
+                    (from_id, to_id)
+                    for from_id in component
+                    for to_id in working_graph.nodes[from_id]
+                    if to_id in members
+                ),
+                key=edge_weights.__getitem__,
+            )
+            from_id, to_id = edge_to_remove
+            working_graph.nodes[from_id].remove(to_id)
+            removed_edges.append(edge_to_remove)
+            cycles.extend(
+                part
+                for part in working_graph.strongly_connected_components(component)
+                if working_graph.is_cycle(part)
+            )
 
         # Topological sort of the cleaned graph
         feature_sequence = working_graph.topological_sort()
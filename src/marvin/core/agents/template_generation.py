@@ -63,8 +63,7 @@ class TemplateGenerationAgent(Agent):
         if not is_valid:
             raise ValueError(f"Generated template is invalid: {error}")
 
-        # Create output path
-        os.makedirs(output_dir, exist_ok=True)
+        # Create output path; save_to_file creates the directory
         output_path = os.path.join(
             output_dir, f"{task.sequence_number:02d}_{feature.id}_{task.task_id}.xml"
         )
@@ -118,15 +117,19 @@ class TemplateGenerationAgent(Agent):
         if codebase:
             affected_files = []
             affected_folders = []
+            feature_name_lower = feature.name.lower()
 
             # In a complete implementation, we would use Context 7 here
             for component in codebase.components:
                 # Simple heuristic: If the component name is contained in the feature name
-                if component.name.lower() in feature.name.lower():
+                if component.name.lower() in feature_name_lower:
                     if component.type == "file":
                         affected_files.append(component.path)
                     elif component.type == "directory":
                         affected_folders.append(component.path)
+                    # Only the first few files and folders are listed
+                    if len(affected_files) >= 5 and len(affected_folders) >= 3:
+                        break
 
             context["affected_files"] = ", ".join(affected_files[:5])
             context["affected_folders"] = ", ".join(affected_folders[:3])
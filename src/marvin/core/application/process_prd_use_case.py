@@ -1,13 +1,18 @@
 """Process PRD use case - main orchestration."""
 
+import asyncio
+import hashlib
 import time
+from collections import OrderedDict
+from copy import deepcopy
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+from uuid import UUID
 
 from ..domain.entities.analysis import AnalysisContext, AnalysisResult
 from ..domain.entities.codebase import CodebaseAnalysis
 from ..domain.entities.prd import PRDDocument
-from ..domain.entities.task import TaskSequence
+from ..domain.entities.task import TaskDefinition, TaskSequence
 from ..domain.services import (
     CodebaseScanner,
     PRDAnalyzer,
@@ -27,13 +32,25 @@ class ProcessPRDUseCase:
         task_sequencer: TaskSequencer,
         template_generator: TemplateGenerator,
         ai_service: AIService,
+        max_concurrent_ai: int = 8,
+        feature_cache_size: int = 128,
     ) -> None:
-        """Initialize the use case with required services."""
+        """Initialize the use case with required services.
+
+        Args:
+            max_concurrent_ai: Maximum number of AI requests in flight at once
+            feature_cache_size: Number of PRDs whose AI-extracted features are
+                kept; 0 disables the cache
+        """
         self.prd_analyzer = prd_analyzer
         self.codebase_scanner = codebase_scanner
         self.task_sequencer = task_sequencer
         self.template_generator = template_generator
         self.ai_service = ai_service
+        self.max_concurrent_ai = max_concurrent_ai
+        self.feature_cache_size = feature_cache_size
+        # SHA-256 of the PRD content -> AI-extracted features, least recent first
+        self._feature_cache: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
     
     async def execute(
         self,
@@ -47,14 +64,21 @@ class ProcessPRDUseCase:
         # Create analysis context
         context = AnalysisContext()
         
-        # Step 1: Analyze PRD
-        prd_document = await self._analyze_prd(prd_path)
-        context.prd_document = prd_document
-        
-        # Step 2: Scan codebase if provided
+        # Steps 1 and 2: Analyze PRD and scan codebase if provided; they are
+        # independent, so run them concurrently. The task group cancels the
+        # other step if one fails, and its first error is re-raised unwrapped
         if codebase_path:
-            codebase_analysis = await self._scan_codebase(codebase_path)
-            context.codebase_analysis = codebase_analysis
+            try:
+                async with asyncio.TaskGroup() as group:
+                    prd_task = group.create_task(self._analyze_prd(prd_path))
+                    scan_task = group.create_task(self._scan_codebase(codebase_path))
+            except ExceptionGroup as error:
+                raise error.exceptions[0] from None
+            prd_document = prd_task.result()
+            context.codebase_analysis = scan_task.result()
+        else:
+            prd_document = await self._analyze_prd(prd_path)
+        context.prd_document = prd_document
         
         # Step 3: Generate task sequence
         task_sequence = await self._generate_task_sequence(context)
@@ -66,31 +90,27 @@ class ProcessPRDUseCase:
         if output_dir:
             await self._save_results(output_dir, task_sequence, templates)
         
-        # Create result
-        result = AnalysisResult(
+        # Create result with its insights
+        return AnalysisResult(
             context=context,
             task_sequence=task_sequence,
             generated_templates=templates,
+            insights=[
+                f"Analyzed {len(prd_document.features)} features",
+                f"Generated {len(task_sequence.tasks)} tasks",
+                "Greenfield project - no existing codebase constraints"
+                if context.is_greenfield
+                else f"Existing codebase with {len(context.codebase_analysis.component_graph.components)} components",
+            ],
             processing_time_seconds=time.time() - start_time,
         )
-        
-        # Add insights
-        result.add_insight(f"Analyzed {len(prd_document.features)} features")
-        result.add_insight(f"Generated {len(task_sequence.tasks)} tasks")
-        
-        if context.is_greenfield:
-            result.add_insight("Greenfield project - no existing codebase constraints")
-        else:
-            result.add_insight(f"Existing codebase with {len(context.codebase_analysis.component_graph.components)} components")
-        
-        return result
     
     async def _analyze_prd(self, prd_path: Path) -> PRDDocument:
         """Analyze the PRD document."""
-        content = prd_path.read_text()
+        content = await asyncio.to_thread(prd_path.read_text)
         
         # Use AI to extract features
-        ai_features = await self.ai_service.extract_features(content)
+        ai_features = await self._extract_features(content)
         
         # Use domain service to build PRD document
         prd_document = self.prd_analyzer.analyze_document(content, {"author": "AI Analysis"})
@@ -100,10 +120,31 @@ class ProcessPRDUseCase:
         
         return prd_document
     
+    async def _extract_features(self, content: str) -> list[dict[str, Any]]:
+        """Extract features with AI, reusing the result for unchanged PRDs.
+
+        The cache keeps its own deep copy and hands out fresh ones, so callers
+        may mutate the returned features.
+        """
+        if self.feature_cache_size <= 0:
+            return await self.ai_service.extract_features(content)
+        
+        key = hashlib.sha256(content.encode()).hexdigest()
+        cached = self._feature_cache.get(key)
+        if cached is not None:
+            self._feature_cache.move_to_end(key)
+            return deepcopy(cached)
+        
+        features = await self.ai_service.extract_features(content)
+        self._feature_cache[key] = deepcopy(features)
+        if len(self._feature_cache) > self.feature_cache_size:
+            self._feature_cache.popitem(last=False)
+        return features
+    
     async def _scan_codebase(self, codebase_path: Path) -> CodebaseAnalysis:
         """Scan and analyze the codebase."""
         # Collect relevant files
-        file_contents = self.codebase_scanner.collect_files(codebase_path)
+        file_contents = await asyncio.to_thread(self.codebase_scanner.collect_files, codebase_path)
         
         # Use AI to analyze structure
         ai_analysis = await self.ai_service.analyze_codebase(file_contents)
@@ -140,41 +181,47 @@ class ProcessPRDUseCase:
         # Build task sequence
         return self.task_sequencer.create_from_ai_result(ai_tasks, context)
     
-    async def _generate_templates(self, task_sequence: TaskSequence, context: AnalysisContext) -> dict[str, str]:
-        """Generate XML templates for all tasks."""
-        templates = {}
-        
-        for task in task_sequence.tasks:
+    async def _generate_templates(self, task_sequence: TaskSequence, context: AnalysisContext) -> dict[UUID, str]:
+        """Generate XML templates for all tasks.
+
+        The AI requests are independent, so they run concurrently, at most
+        max_concurrent_ai at a time.
+        """
+        context_dict = {
+            "is_greenfield": context.is_greenfield,
+            "has_codebase": context.has_codebase,
+        }
+        semaphore = asyncio.Semaphore(self.max_concurrent_ai)
+        
+        async def generate(task: TaskDefinition) -> str:
             task_dict = {
                 "id": str(task.id),
                 "name": task.name,
                 "description": task.description,
                 "type": str(task.type),
             }
-            
-            context_dict = {
-                "is_greenfield": context.is_greenfield,
-                "has_codebase": context.has_codebase,
-            }
-            
-            template = await self.ai_service.generate_xml_template(task_dict, context_dict)
-            templates[task.id] = template
+            async with semaphore:
+                return await self.ai_service.generate_xml_template(task_dict, context_dict)
         
-        return templates
+        results = await asyncio.gather(*(generate(task) for task in task_sequence.tasks))
+        return {task.id: template for task, template in zip(task_sequence.tasks, results, strict=True)}
     
-    async def _save_results(self, output_dir: Path, task_sequence: TaskSequence, templates: dict[str, str]) -> None:
+    async def _save_results(self, output_dir: Path, task_sequence: TaskSequence, templates: dict[UUID, str]) -> None:
         """Save results to output directory."""
-        output_dir.mkdir(parents=True, exist_ok=True)
+        templates_dir = output_dir / "templates"
+        templates_dir.mkdir(parents=True, exist_ok=True)
         
         # Save task sequence summary
         summary_path = output_dir / "task_sequence.json"
         # Would implement JSON serialization here
         
-        # Save individual templates
-        templates_dir = output_dir / "templates"
-        templates_dir.mkdir(exist_ok=True)
-        
-        for task in task_sequence.tasks:
-            if task.id in templates:
-                template_path = templates_dir / f"{task.sequence_number:03d}_{task.name.replace(' ', '_')}.xml"
-                template_path.write_text(templates[task.id])
+        # Save individual templates, numbered by their position in the sequence
+        writes = [
+            asyncio.to_thread(
+                (templates_dir / f"{number:03d}_{task.name.replace(' ', '_')}.xml").write_text,
+                templates[task.id],
+            )
+            for number, task in enumerate(task_sequence.tasks, 1)
+            if task.id in templates
+        ]
+        await asyncio.gather(*writes)
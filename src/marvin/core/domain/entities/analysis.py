@@ -10,7 +10,7 @@ from .prd import PRDDocument
 from .task import TaskSequence
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisContext:
     """Context for the analysis process."""
     
@@ -31,7 +31,7 @@ class AnalysisContext:
         return not self.has_codebase
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of the complete analysis process."""
     
@@ -1,5 +1,6 @@
 """Codebase analysis domain entities."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -34,7 +35,7 @@ class TechnologyCategory(str, Enum):
     INFRASTRUCTURE = "infrastructure"
 
 
-@dataclass
+@dataclass(slots=True)
 class Technology:
     """Represents a technology used in the codebase."""
     
@@ -45,7 +46,7 @@ class Technology:
     dependencies: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Component:
     """Represents a component in the codebase."""
     
@@ -58,28 +59,57 @@ class Component:
     exports: Set[str] = field(default_factory=set)
     dependencies: list[UUID] = field(default_factory=list)
     
+    def __eq__(self, other: object) -> bool:
+        """Compare components by ID."""
+        if not isinstance(other, Component):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash by ID, so components can be collected in sets."""
+        return hash(self.id)
+    
     @property
     def is_entry_point(self) -> bool:
         """Check if this component is an entry point."""
         return self.type in [ComponentType.SERVICE, ComponentType.API_ENDPOINT]
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentGraph:
     """Represents the dependency graph of components."""
     
     components: dict[UUID, Component] = field(default_factory=dict)
     edges: dict[UUID, Set[UUID]] = field(default_factory=dict)
+    # Dependency ID -> IDs of the components depending on it
+    reverse_edges: dict[UUID, Set[UUID]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Transitive closures, computed per strongly connected component on demand
+    _closures: Optional[dict[UUID, frozenset[UUID]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        """Index the initial edges by dependency."""
+        for comp_id, deps in self.edges.items():
+            for dep_id in deps:
+                self.reverse_edges.setdefault(dep_id, set()).add(comp_id)
     
     def add_component(self, component: Component) -> None:
         """Add a component to the graph."""
-        self.components[component.id] = component
-        if component.id not in self.edges:
-            self.edges[component.id] = set()
+        self.add_components((component,))
+    
+    def add_components(self, components: Iterable[Component]) -> None:
+        """Add several components to the graph."""
+        for component in components:
+            self.components[component.id] = component
+            # Add edges for dependencies
+            self.edges.setdefault(component.id, set()).update(component.dependencies)
+            for dep_id in component.dependencies:
+                self.reverse_edges.setdefault(dep_id, set()).add(component.id)
         
-        # Add edges for dependencies
-        for dep_id in component.dependencies:
-            self.edges[component.id].add(dep_id)
+        self._closures = None
     
     def get_dependencies(self, component_id: UUID) -> Set[Component]:
         """Get all dependencies of a component."""
@@ -88,14 +118,83 @@ class ComponentGraph:
     
     def get_dependents(self, component_id: UUID) -> Set[Component]:
         """Get all components that depend on this component."""
-        dependents = set()
-        for comp_id, deps in self.edges.items():
-            if component_id in deps:
-                dependents.add(self.components[comp_id])
-        return dependents
+        comp_ids = self.reverse_edges.get(component_id, set())
+        return {self.components[comp_id] for comp_id in comp_ids if comp_id in self.components}
+    
+    def transitive_dependencies(self, component_id: UUID) -> frozenset[UUID]:
+        """Get the IDs a component depends on, directly or transitively.
+        
+        The component itself is only included when it lies on a dependency cycle.
+        """
+        if self._closures is None:
+            self._closures = self._compute_closures()
+        return self._closures.get(component_id, frozenset())
+    
+    def _compute_closures(self) -> dict[UUID, frozenset[UUID]]:
+        """Compute every transitive closure with one pass of Tarjan's algorithm.
+        
+        Tarjan emits strongly connected components in reverse topological
+        order, so each component's closure can be built from the closures of
+        its successors as soon as it is emitted, and is shared by all members.
+        """
+        index: dict[UUID, int] = {}
+        lowlink: dict[UUID, int] = {}
+        on_stack: Set[UUID] = set()
+        scc_stack: list[UUID] = []
+        # Node -> closure of its SCC including the members themselves
+        reach: dict[UUID, frozenset[UUID]] = {}
+        closures: dict[UUID, frozenset[UUID]] = {}
+        empty: Set[UUID] = set()
+        
+        for root in self.edges:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            scc_stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.edges.get(root, empty)))]
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        scc_stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.edges.get(child, empty))))
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] != index[node]:
+                        continue
+                    
+                    members = set()
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        members.add(member)
+                        if member == node:
+                            break
+                    below: Set[UUID] = set()
+                    for member in members:
+                        for dep_id in self.edges.get(member, empty):
+                            if dep_id not in members:
+                                below |= reach[dep_id]
+                    cyclic = len(members) > 1 or node in self.edges.get(node, empty)
+                    full = frozenset(below | members)
+                    closure = full if cyclic else frozenset(below)
+                    for member in members:
+                        reach[member] = full
+                        closures[member] = closure
+        
+        return closures
 
 
-@dataclass
+@dataclass(slots=True)
 class TechnologyStack:
     """Represents the technology stack of a codebase."""
     
@@ -119,7 +218,7 @@ class TechnologyStack:
             self.tools.append(tech)
 
 
-@dataclass
+@dataclass(slots=True)
 class CodebaseAnalysis:
     """Represents a complete codebase analysis."""
     
@@ -129,10 +228,16 @@ class CodebaseAnalysis:
     component_graph: ComponentGraph = field(default_factory=ComponentGraph)
     technology_stack: TechnologyStack = field(default_factory=TechnologyStack)
     architecture_patterns: list[str] = field(default_factory=list)
-    entry_points: list[Component] = field(default_factory=list)
+    
+    @property
+    def entry_points(self) -> list[Component]:
+        """Get the entry-point components of the analyzed codebase."""
+        return [c for c in self.component_graph.components.values() if c.is_entry_point]
     
     def add_component(self, component: Component) -> None:
         """Add a component to the analysis."""
         self.component_graph.add_component(component)
-        if component.is_entry_point:
-            self.entry_points.append(component)
+    
+    def add_components(self, components: Iterable[Component]) -> None:
+        """Add several components to the analysis."""
+        self.component_graph.add_components(components)
@@ -1,5 +1,6 @@
 """PRD-related domain entities."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -27,7 +28,7 @@ class PriorityLevel(str, Enum):
     NICE_TO_HAVE = "nice_to_have"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class UserStory:
     """Represents a user story in the PRD."""
     
@@ -37,13 +38,23 @@ class UserStory:
     benefit: str = ""
     acceptance_criteria: list[str] = field(default_factory=list)
     
+    def __eq__(self, other: object) -> bool:
+        """Compare user stories by ID."""
+        if not isinstance(other, UserStory):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash by ID, consistently with __eq__."""
+        return hash(self.id)
+    
     @property
     def formatted_story(self) -> str:
         """Returns the user story in standard format."""
         return f"As a {self.persona}, I want to {self.goal} so that {self.benefit}"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Requirement:
     """Represents a requirement in the PRD."""
     
@@ -54,9 +65,19 @@ class Requirement:
     rationale: Optional[str] = None
     constraints: list[str] = field(default_factory=list)
     dependencies: list[UUID] = field(default_factory=list)
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare requirements by ID."""
+        if not isinstance(other, Requirement):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash by ID, consistently with __eq__."""
+        return hash(self.id)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class FeatureSpecification:
     """Represents a feature specification in the PRD."""
     
@@ -70,6 +91,16 @@ class FeatureSpecification:
     dependencies: list[UUID] = field(default_factory=list)
     tags: list[str] = field(default_factory=list)
     
+    def __eq__(self, other: object) -> bool:
+        """Compare features by ID."""
+        if not isinstance(other, FeatureSpecification):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash by ID, consistently with __eq__."""
+        return hash(self.id)
+    
     def add_requirement(self, requirement: Requirement) -> None:
         """Add a requirement to the feature."""
         self.requirements.append(requirement)
@@ -79,7 +110,7 @@ class FeatureSpecification:
         self.user_stories.append(story)
 
 
-@dataclass
+@dataclass(slots=True)
 class PRDDocument:
     """Represents a Product Requirements Document."""
     
@@ -95,7 +126,11 @@ class PRDDocument:
     
     def add_feature(self, feature: FeatureSpecification) -> None:
         """Add a feature to the PRD."""
-        self.features.append(feature)
+        self.add_features((feature,))
+    
+    def add_features(self, features: Iterable[FeatureSpecification]) -> None:
+        """Add several features to the PRD, touching updated_at once."""
+        self.features.extend(features)
         self.updated_at = datetime.now()
     
     def get_features_by_priority(self, priority: PriorityLevel) -> list[FeatureSpecification]:
@@ -104,7 +139,4 @@ class PRDDocument:
     
     def get_dependency_graph(self) -> dict[UUID, list[UUID]]:
         """Build a dependency graph of all features."""
-        graph = {}
-        for feature in self.features:
-            graph[feature.id] = feature.dependencies
-        return graph
+        return {f.id: f.dependencies for f in self.features}
@@ -1,5 +1,6 @@
 """Task-related domain entities."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -30,7 +31,7 @@ class TaskComplexity(str, Enum):
     EXPERT = "expert"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskContext:
     """Context information for a task."""
     
@@ -42,7 +43,7 @@ class TaskContext:
     reference_examples: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TaskDefinition:
     """Represents an AI coding task."""
     
@@ -56,9 +57,19 @@ class TaskDefinition:
     estimated_time: Optional[str] = None
     acceptance_criteria: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare tasks by ID."""
+        if not isinstance(other, TaskDefinition):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash by ID, consistently with __eq__."""
+        return hash(self.id)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskTemplate:
     """Represents an XML template for an AI coding task."""
     
@@ -73,7 +84,7 @@ class TaskTemplate:
         return self.template_content
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskSequence:
     """Represents a sequence of tasks with dependencies."""
     
@@ -86,41 +97,51 @@ class TaskSequence:
     
     def add_task(self, task: TaskDefinition) -> None:
         """Add a task to the sequence."""
-        self.tasks.append(task)
+        self.add_tasks((task,))
+    
+    def add_tasks(self, tasks: Iterable[TaskDefinition]) -> None:
+        """Add several tasks to the sequence, reordering it once."""
+        self.tasks.extend(tasks)
         self._update_execution_order()
     
     def _update_execution_order(self) -> None:
         """Update the execution order based on dependencies."""
-        # Topological sort implementation
-        visited = set()
-        order = []
+        # Topological sort implementation: an iterative depth-first search
+        # that lists each task after its prerequisites
+        by_id: dict[UUID, TaskDefinition] = {}
+        for task in self.tasks:
+            by_id.setdefault(task.id, task)
         
-        def visit(task_id: UUID) -> None:
-            if task_id in visited:
-                return
-            visited.add(task_id)
-            
-            task = next((t for t in self.tasks if t.id == task_id), None)
-            if task:
-                for prereq in task.prerequisites:
-                    visit(prereq)
-                order.append(task_id)
+        visited: set[UUID] = set()
+        order: list[UUID] = []
         
         for task in self.tasks:
-            visit(task.id)
+            if task.id in visited:
+                continue
+            visited.add(task.id)
+            stack = [(task.id, iter(by_id[task.id].prerequisites))]
+            while stack:
+                task_id, prereqs = stack[-1]
+                for prereq in prereqs:
+                    if prereq in visited:
+                        continue
+                    visited.add(prereq)
+                    prereq_task = by_id.get(prereq)
+                    if prereq_task is not None:
+                        stack.append((prereq, iter(prereq_task.prerequisites)))
+                        break
+                else:
+                    stack.pop()
+                    order.append(task_id)
         
         self.execution_order = order
     
     def get_next_tasks(self, completed_task_ids: Set[UUID]) -> list[TaskDefinition]:
         """Get the next tasks that can be executed."""
-        available_tasks = []
-        
-        for task in self.tasks:
-            if task.id in completed_task_ids:
-                continue
-            
-            # Check if all prerequisites are completed
-            if all(prereq in completed_task_ids for prereq in task.prerequisites):
-                available_tasks.append(task)
-        
-        return available_tasks
+        # Open tasks whose prerequisites are all completed
+        return [
+            task
+            for task in self.tasks
+            if task.id not in completed_task_ids
+            and completed_task_ids.issuperset(task.prerequisites)
+        ]
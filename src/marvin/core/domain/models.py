@@ -1,10 +1,50 @@
 """Domain models for Marvin."""
 
+from bisect import insort
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from functools import cache
+from operator import attrgetter
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import TypeAdapter
+
+
+@cache
+def _adapter(tp: Any) -> TypeAdapter:
+    """Returns the (cached) validator for a model type."""
+    return TypeAdapter(tp)
+
+
+class _Model:
+    """Base for domain models.
+
+    Models are plain slotted dataclasses, so constructing them internally does
+    no validation. Untrusted input should go through ``from_dict`` or, for
+    batches, ``list_from_dicts``.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Validates a mapping and builds a model from it.
+
+        Raises:
+            pydantic.ValidationError: If the data does not match the model.
+        """
+        return _adapter(cls).validate_python(data)
+
+    @classmethod
+    def list_from_dicts(cls, rows: list[dict[str, Any]]) -> list[Self]:
+        """Validates a batch of mappings in one call and builds models from them.
+
+        Raises:
+            pydantic.ValidationError: If any row does not match the model.
+        """
+        return _adapter(list[cls]).validate_python(rows)
 
 
 class FeatureStatus(str, Enum):
@@ -18,7 +58,8 @@ class FeatureStatus(str, Enum):
     REJECTED = "rejected"
 
 
-class UserStory(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class UserStory(_Model):
     """A user story for a feature."""
 
     story: str
@@ -28,21 +69,22 @@ class UserStory(BaseModel):
     benefit: str | None = None
 
 
-class Feature(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Feature(_Model):
     """A feature from a PRD."""
 
     id: str
     title: str  # Changed from name to title for consistency
     description: str
-    requirements: list[str] = Field(default_factory=list)
-    dependencies: list[str] = Field(default_factory=list)
+    requirements: list[str] = field(default_factory=list)
+    dependencies: list[str] = field(default_factory=list)
     status: FeatureStatus = FeatureStatus.PROPOSED
     priority: int = 1  # 0=High, 1=Medium, 2=Low (restored for backward compatibility)
     effort: str | None = None  # Changed from estimated_effort
-    tags: list[str] = Field(default_factory=list)
-    user_stories: list[UserStory] = Field(default_factory=list)
-    acceptance_criteria: list[str] = Field(default_factory=list)
-    definition_of_done: list[str] = Field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    user_stories: list[UserStory] = field(default_factory=list)
+    acceptance_criteria: list[str] = field(default_factory=list)
+    definition_of_done: list[str] = field(default_factory=list)
 
     def is_valid(self) -> bool:
         """Validate feature data."""
@@ -59,7 +101,8 @@ class Feature(BaseModel):
         return self.title
 
 
-class PRD(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class PRD(_Model):
     """A Product Requirements Document."""
 
     id: str
@@ -69,14 +112,18 @@ class PRD(BaseModel):
     created_at: datetime
     updated_at: datetime
     version: str
-    features: list[Feature] = Field(default_factory=list)
-    tags: list[str] = Field(default_factory=list)
-    metadata: dict[str, Any] = Field(default_factory=dict)
-    dependency_graph: dict[str, list[str]] = Field(default_factory=dict)
+    features: list[Feature] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    dependency_graph: dict[str, list[str]] = field(default_factory=dict)
 
     def add_feature(self, feature: Feature) -> None:
         """Adds a feature to the PRD."""
-        self.features.append(feature)
+        self.add_features((feature,))
+
+    def add_features(self, features: Iterable[Feature]) -> None:
+        """Adds several features to the PRD, touching updated_at once."""
+        self.features.extend(features)
         self.updated_at = datetime.now()
 
     def is_valid(self) -> bool:
@@ -89,18 +136,20 @@ class PRD(BaseModel):
         )
 
 
-class Component(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Component(_Model):
     """A component of a codebase."""
 
     name: str
     path: str
     type: str  # file, directory, module, class, etc.
     description: str | None = None
-    dependencies: list[str] = Field(default_factory=list)
-    tags: list[str] = Field(default_factory=list)
+    dependencies: list[str] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
 
 
-class Technology(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Technology(_Model):
     """A technology used in a codebase."""
 
     name: str
@@ -109,16 +158,17 @@ class Technology(BaseModel):
     description: str | None = None
 
 
-class Codebase(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Codebase(_Model):
     """An analyzed codebase."""
 
     id: str
     name: str
     root_path: str
-    components: list[Component] = Field(default_factory=list)
-    technologies: list[Technology] = Field(default_factory=list)
-    scanned_at: datetime = Field(default_factory=datetime.now)
-    architecture_patterns: list[str] = Field(default_factory=list)
+    components: list[Component] = field(default_factory=list)
+    technologies: list[Technology] = field(default_factory=list)
+    scanned_at: datetime = field(default_factory=datetime.now)
+    architecture_patterns: list[str] = field(default_factory=list)
 
     def add_component(self, component: Component) -> None:
         """Adds a component to the codebase."""
@@ -135,7 +185,8 @@ class TaskStatus(str, Enum):
     FAILED = "failed"
 
 
-class Task(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Task(_Model):
     """An AI coding task."""
 
     task_id: str
@@ -143,11 +194,11 @@ class Task(BaseModel):
     name: str
     description: str
     feature_id: str
-    depends_on: list[str] = Field(default_factory=list)
+    depends_on: list[str] = field(default_factory=list)
     template_path: str | None = None
     status: TaskStatus = TaskStatus.PLANNED
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
 
     @property
     def is_blocked(self) -> bool:
@@ -155,7 +206,8 @@ class Task(BaseModel):
         return self.status == TaskStatus.BLOCKED
 
 
-class Workflow(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Workflow(_Model):
     """A workflow with a sequence of tasks."""
 
     id: str
@@ -163,12 +215,16 @@ class Workflow(BaseModel):
     description: str
     prd_id: str
     codebase_id: str | None = None
-    tasks: list[Task] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    tasks: list[Task] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
 
     def add_task(self, task: Task) -> None:
         """Adds a task to the workflow."""
-        self.tasks.append(task)
-        self.tasks.sort(key=lambda x: x.sequence_number)
+        self.add_tasks((task,))
+
+    def add_tasks(self, tasks: Iterable[Task]) -> None:
+        """Adds several tasks to the workflow, touching updated_at once."""
+        for task in tasks:
+            insort(self.tasks, task, key=attrgetter("sequence_number"))
         self.updated_at = datetime.now()
@@ -1,13 +1,40 @@
 """Domain services for Marvin."""
 
-from .prd_analyzer import PRDAnalyzer
-from .codebase_scanner import CodebaseScanner
-from .task_sequencer import TaskSequencer
-from .template_generator import TemplateGenerator
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .codebase_scanner import CodebaseScanner
+    from .prd_analyzer import PRDAnalyzer
+    from .task_sequencer import TaskSequencer
+    from .template_generator import TemplateGenerator
 
 __all__ = [
     "PRDAnalyzer",
-    "CodebaseScanner", 
+    "CodebaseScanner",
     "TaskSequencer",
     "TemplateGenerator",
 ]
+
+# Service name -> defining submodule, imported on first access
+_SERVICE_MODULES = {
+    "PRDAnalyzer": ".prd_analyzer",
+    "CodebaseScanner": ".codebase_scanner",
+    "TaskSequencer": ".task_sequencer",
+    "TemplateGenerator": ".template_generator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a service from its submodule the first time it is accessed."""
+    module_name = _SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported services along with the module globals."""
+    return sorted({*globals(), *__all__})
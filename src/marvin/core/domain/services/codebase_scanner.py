@@ -1,5 +1,6 @@
 """Codebase scanner domain service."""
 
+import os
 from pathlib import Path
 from typing import Any
 
@@ -13,38 +14,64 @@ from ..entities.codebase import (
     TechnologyStack,
 )
 
+# Directories whose contents are never collected
+_EXCLUDED_DIRS = frozenset({
+    ".git", "node_modules", ".venv", "__pycache__",
+    "dist", "build", ".mypy_cache", ".pytest_cache",
+})
+
+# File extensions worth sending to the codebase analysis
+_RELEVANT_EXTENSIONS = frozenset({
+    ".py", ".js", ".ts", ".jsx", ".tsx", ".java", ".cpp", ".c",
+    ".cs", ".go", ".rs", ".rb", ".php", ".dart", ".swift", ".kt",
+    ".yaml", ".yml", ".json", ".toml", ".xml", ".md", ".txt",
+})
+
 
 class CodebaseScanner:
     """Service for scanning and analyzing codebases."""
     
     def __init__(self) -> None:
         """Initialize the codebase scanner."""
-        self.relevant_extensions = {
-            ".py", ".js", ".ts", ".jsx", ".tsx", ".java", ".cpp", ".c",
-            ".cs", ".go", ".rs", ".rb", ".php", ".dart", ".swift", ".kt",
-            ".yaml", ".yml", ".json", ".toml", ".xml", ".md", ".txt",
-        }
+        self.relevant_extensions = _RELEVANT_EXTENSIONS
     
     def collect_files(self, root_path: Path, max_files: int = 100) -> dict[str, str]:
         """Collect relevant files from the codebase."""
-        files = {}
-        count = 0
+        files: dict[str, str] = {}
+        if max_files <= 0:
+            return files
         
-        for file_path in root_path.rglob("*"):
-            if count >= max_files:
-                break
-            
-            if file_path.is_file() and file_path.suffix in self.relevant_extensions:
-                # Skip common directories
-                if any(part in file_path.parts for part in [".git", "node_modules", ".venv", "__pycache__"]):
-                    continue
-                
-                try:
-                    relative_path = file_path.relative_to(root_path)
-                    files[str(relative_path)] = file_path.read_text(errors="ignore")
-                    count += 1
-                except Exception:
-                    continue
+        # Depth-first walk over os.scandir entries, so file types come from the
+        # directory listing and excluded directories are never entered
+        relevant_extensions = self.relevant_extensions
+        root = str(root_path)
+        stack = [root]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _EXCLUDED_DIRS:
+                                subdirs.append(entry.path)
+                            continue
+                        if (
+                            os.path.splitext(entry.name)[1] not in relevant_extensions
+                            or not entry.is_file()
+                        ):
+                            continue
+                        
+                        try:
+                            content = Path(entry.path).read_text(errors="ignore")
+                        except Exception:
+                            continue
+                        files[os.path.relpath(entry.path, root)] = content
+                        if len(files) >= max_files:
+                            return files
+            except OSError:
+                continue
+            # Visit subdirectories in listing order, like rglob
+            stack.extend(reversed(subdirs))
         
         return files
     
@@ -85,13 +112,14 @@ class CodebaseScanner:
         analysis.architecture_patterns = ai_analysis.get("architecture_patterns", [])
         
         # Components
-        for comp_data in ai_analysis.get("components", []):
-            component = Component(
+        analysis.add_components(
+            Component(
                 name=comp_data.get("name", ""),
                 path=Path(comp_data.get("path", "")),
                 type=ComponentType(comp_data.get("type", "file")),
                 description=comp_data.get("description"),
             )
-            analysis.add_component(component)
+            for comp_data in ai_analysis.get("components", [])
+        )
         
         return analysis
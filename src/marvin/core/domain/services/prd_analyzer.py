@@ -13,6 +13,26 @@ from ..entities.prd import (
     UserStory,
 )
 
+# Heading markers that start each section of a PRD.
+_HEADING_SPLIT_RE = re.compile(r'^#+\s+', re.MULTILINE)
+
+# Feature sections, optionally titled "Feature: ...", up to the next "##".
+_FEATURE_SECTION_RE = re.compile(
+    r'(?:###+\s*Feature[:\s]+|###+\s*)(.+?)(?=\n##|$)',
+    re.DOTALL | re.MULTILINE,
+)
+
+# "As a ..., I want ... so that ..." user stories.
+_USER_STORY_RE = re.compile(
+    r"[Aa]s\s+a\s+(.+?),?\s*[Ii]\s+want\s+(?:to\s+)?(.+?)\s+so\s+that\s+(.+?)(?:\.|$)",
+    re.MULTILINE,
+)
+
+# Bullet point requirements, each running up to the next bullet.
+_REQUIREMENT_RE = re.compile(
+    r'(?:^|\n)\s*[-*•]\s+(.+?)(?=\n\s*[-*•]|$)', re.MULTILINE | re.DOTALL
+)
+
 
 class PRDAnalyzer:
     """Service for analyzing PRD documents."""
@@ -36,9 +56,7 @@ class PRDAnalyzer:
         )
         
         # Extract features
-        features = self._extract_features(content)
-        for feature in features:
-            prd.add_feature(feature)
+        prd.add_features(self._extract_features(content))
         
         return prd
     
@@ -59,7 +77,7 @@ class PRDAnalyzer:
     def _extract_description(self, content: str) -> str:
         """Extract description from PRD content."""
         # Look for overview or description section
-        sections = re.split(r'^#+\s+', content, flags=re.MULTILINE)
+        sections = _HEADING_SPLIT_RE.split(content)
         for section in sections:
             if any(word in section.lower()[:50] for word in ['overview', 'description', 'introduction']):
                 return section.strip().split('\n', 1)[1].strip() if '\n' in section else section.strip()
@@ -70,11 +88,7 @@ class PRDAnalyzer:
         features = []
         
         # Simple pattern matching for features
-        feature_sections = re.findall(
-            r'(?:###+\s*Feature[:\s]+|###+\s*)(.+?)(?=\n##|$)',
-            content,
-            re.DOTALL | re.MULTILINE
-        )
+        feature_sections = _FEATURE_SECTION_RE.findall(content)
         
         for i, section in enumerate(feature_sections):
             feature = self._parse_feature_section(section, i)
@@ -125,8 +139,7 @@ class PRDAnalyzer:
         stories = []
         
         # Pattern for "As a... I want... so that..."
-        pattern = r"[Aa]s\s+a\s+(.+?),?\s*[Ii]\s+want\s+(?:to\s+)?(.+?)\s+so\s+that\s+(.+?)(?:\.|$)"
-        matches = re.findall(pattern, section, re.MULTILINE)
+        matches = _USER_STORY_RE.findall(section)
         
         for persona, goal, benefit in matches:
             story = UserStory(
@@ -143,8 +156,7 @@ class PRDAnalyzer:
         requirements = []
         
         # Look for bullet points or numbered lists
-        req_pattern = r'(?:^|\n)\s*[-*•]\s+(.+?)(?=\n\s*[-*•]|$)'
-        matches = re.findall(req_pattern, section, re.MULTILINE | re.DOTALL)
+        matches = _REQUIREMENT_RE.findall(section)
         
         for match in matches:
             req = Requirement(
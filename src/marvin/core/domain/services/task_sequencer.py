@@ -24,19 +24,22 @@ class TaskSequencer:
         )
         
         # Create task definitions
+        tasks = []
         task_map = {}
         for i, ai_task in enumerate(ai_tasks):
             task = self._create_task_from_ai(ai_task, i + 1, context)
             task_map[ai_task.get("task_id", str(task.id))] = task
-            sequence.add_task(task)
+            tasks.append(task)
         
         # Set up dependencies
-        for ai_task, task in zip(ai_tasks, sequence.tasks):
+        for ai_task, task in zip(ai_tasks, tasks):
             dep_ids = ai_task.get("dependencies", [])
             for dep_id in dep_ids:
                 if dep_task := task_map.get(dep_id):
                     task.prerequisites.append(dep_task.id)
         
+        # Order the tasks once, now that their prerequisites are known
+        sequence.add_tasks(tasks)
         return sequence
     
     def _create_task_from_ai(self, ai_task: dict[str, Any], sequence_num: int, context: AnalysisContext) -> TaskDefinition:
@@ -1,13 +1,27 @@
 """Generator for XML-based AI coding tasks."""
 
 import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from lxml import etree
 
 from marvin.core.domain.models import PRD, Codebase, Feature, Task
 
+# "{name}" placeholders of a template.
+_PLACEHOLDER_RE = re.compile(r"{([^{}]+)}")
+
+
+@lru_cache(maxsize=32)
+def _template_placeholders(template: str) -> tuple[str, ...]:
+    """Returns the distinct placeholder names of a template, in order.
+
+    Shared by all generators, so each template is scanned once per process.
+    """
+    return tuple(dict.fromkeys(_PLACEHOLDER_RE.findall(template)))
+
 
 class XMLTemplateGenerator:
     """Generator for XML-based AI coding tasks."""
@@ -298,13 +312,8 @@ class XMLTemplateGenerator:
         Args:
             context: The context for template generation
         """
-        # Extract all placeholders from the template
-        import re
-
-        placeholders = re.findall(r"{([^{}]+)}", self.template_content)
-
         # Fill missing placeholders with default values
-        for placeholder in placeholders:
+        for placeholder in _template_placeholders(self.template_content):
             if placeholder not in context:
                 context[placeholder] = ""
 
@@ -0,0 +1,45 @@
+"""
+Unit tests for the codebase scanner domain service.
+"""
+
+from pathlib import Path
+
+from marvin.core.domain.services.codebase_scanner import CodebaseScanner
+
+
+def _write(path: Path, content: str = "") -> None:
+    """Writes a file, creating its parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+class TestCollectFiles:
+    """Test cases for CodebaseScanner.collect_files."""
+
+    def test_collects_relevant_files_and_skips_excluded_directories(
+        self, tmp_path: Path
+    ):
+        """Test that only relevant files outside excluded directories are read."""
+        _write(tmp_path / "main.py", "print('hi')")
+        _write(tmp_path / "src" / "app" / "views.ts", "export {}")
+        _write(tmp_path / "image.png", "binary")
+        _write(tmp_path / "node_modules" / "lib" / "index.js", "ignored")
+        _write(tmp_path / "src" / "__pycache__" / "views.py", "ignored")
+        _write(tmp_path / "dist" / "bundle.js", "ignored")
+        _write(tmp_path / ".pytest_cache" / "README.md", "ignored")
+
+        files = CodebaseScanner().collect_files(tmp_path)
+
+        assert files == {
+            "main.py": "print('hi')",
+            str(Path("src", "app", "views.ts")): "export {}",
+        }
+
+    def test_stops_at_max_files_after_shallower_files(self, tmp_path: Path):
+        """Test that the walk lists a directory's files before its subdirectories."""
+        _write(tmp_path / "nested" / "deep.py")
+        _write(tmp_path / "top.py")
+
+        files = CodebaseScanner().collect_files(tmp_path, max_files=1)
+
+        assert list(files) == ["top.py"]
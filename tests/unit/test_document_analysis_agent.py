@@ -4,11 +4,15 @@ Unit tests for DocumentAnalysisAgent.
 Following TDD approach - write tests first, then implement.
 """
 
+import asyncio
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from marvin.core.agents import document_analysis
 from marvin.core.agents.document_analysis import DocumentAnalysisAgent
+from marvin.core.domain.models import Feature
 
 
 class TestDocumentAnalysisAgent:
@@ -336,3 +340,482 @@ Create tasks easily.
         # Assert
         assert "amazing application" in prd.description.lower()
         assert "manage their daily tasks" in prd.description
+
+    def test_generate_feature_id_strips_special_characters(self):
+        """Test that feature IDs keep only lowercase alphanumerics and dashes."""
+        feature_id = self.agent._generate_feature_id("  Café: Log-In (v2)!  ", 3)
+
+        assert feature_id == "caf_log-in_v2_03"
+
+    @pytest.mark.asyncio
+    async def test_execute_caches_unchanged_documents(self, tmp_path: Path):
+        """Test that re-analyzing an unchanged document reuses the cached result."""
+        prd_file = tmp_path / "test_prd.md"
+        prd_file.write_text("# PRD: Cached App\n\n## Features\n\n### Login\nLog in.\n")
+
+        with patch.object(
+            self.agent, "_analyze_markdown", wraps=self.agent._analyze_markdown
+        ) as analyze:
+            first_prd, first_features = await self.agent.execute(str(prd_file))
+            second_prd, second_features = await self.agent.execute(str(prd_file))
+
+        assert analyze.call_count == 1
+        assert second_prd == first_prd
+        assert second_features == first_features
+        assert second_prd is not first_prd
+
+    @pytest.mark.asyncio
+    async def test_execute_cache_invalidated_on_change(self, tmp_path: Path):
+        """Test that modifying a document invalidates its cached analysis."""
+        prd_file = tmp_path / "test_prd.md"
+        prd_file.write_text("# PRD: First Title\n")
+        prd, _ = await self.agent.execute(str(prd_file))
+        assert prd.title == "First Title"
+
+        prd_file.write_text("# PRD: A Different Title\n")
+        prd, _ = await self.agent.execute(str(prd_file))
+        assert prd.title == "A Different Title"
+
+    @pytest.mark.asyncio
+    async def test_execute_cache_evicts_least_recently_used(self, tmp_path: Path):
+        """Test that the analysis cache keeps at most analysis_cache_size entries."""
+        agent = DocumentAnalysisAgent(config={"analysis_cache_size": 2})
+        paths = []
+        for name in ("a", "b", "c"):
+            prd_file = tmp_path / f"{name}.md"
+            prd_file.write_text(f"# PRD: {name}\n")
+            paths.append(str(prd_file))
+
+        await agent.execute(paths[0])
+        await agent.execute(paths[1])
+        await agent.execute(paths[0])  # Refreshes a.md
+        await agent.execute(paths[2])  # Evicts b.md
+
+        cached_paths = [key[0] for key in agent._analysis_cache]
+        assert cached_paths == [paths[0], paths[2]]
+
+    def test_extract_requirements_collects_subsection_blocks(self):
+        """Test that requirements from every subsection are collected once."""
+        feature_content = """Complete user lifecycle management.
+
+#### 1.1 Registration
+**Requirements:**
+- Email verification required
+- Password strength validation
+
+#### 1.2 Authentication
+**Requirements:**
+- REQ-1.2: Multi-factor authentication
+
+**Dependencies:** Registration
+- Not a requirement
+"""
+        requirements = self.agent._extract_requirements(feature_content)
+
+        assert requirements == [
+            "Email verification required",
+            "Password strength validation",
+            "Multi-factor authentication",
+        ]
+
+    def test_extract_features_stops_at_next_section(self):
+        """Test that only ### headings inside the Features section are features."""
+        content = """# PRD: Test App
+
+## Features
+
+### Login
+Allow users to log in.
+
+## Appendix
+
+### Glossary
+Terms used in this document.
+"""
+        features = self.agent._extract_features(content)
+
+        assert [feature.title for feature in features] == ["Login"]
+
+    @pytest.mark.asyncio
+    async def test_execute_analyzes_documents_concurrently(self, tmp_path: Path):
+        """Test that several documents can be analyzed with asyncio.gather."""
+        paths = []
+        for i in range(3):
+            prd_file = tmp_path / f"prd_{i}.md"
+            prd_file.write_text(f"# PRD: App {i}\n")
+            paths.append(str(prd_file))
+
+        results = await asyncio.gather(*(self.agent.execute(p) for p in paths))
+
+        assert [prd.title for prd, _ in results] == ["App 0", "App 1", "App 2"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_markdown_normalizes_line_endings(self, tmp_path: Path):
+        """Test that Windows line endings are parsed like Unix ones."""
+        prd_file = tmp_path / "test_prd.md"
+        prd_file.write_bytes(
+            b"# PRD: Test App\r\n\r\nAuthor: Jane Smith\r\n\r\n"
+            b"## Features\r\n\r\n### Login\r\nAllow users to log in.\r\n"
+        )
+
+        prd, features = await self.agent.execute(str(prd_file))
+
+        assert prd.title == "Test App"
+        assert prd.author == "Jane Smith"
+        assert [feature.name for feature in features] == ["Login"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_markdown_uses_single_default_timestamp(self, tmp_path: Path):
+        """Test that default created/updated timestamps are identical."""
+        prd_file = tmp_path / "test_prd.md"
+        prd_file.write_text("# PRD: Test App\n")
+
+        prd, _ = await self.agent.execute(str(prd_file))
+
+        assert prd.created_at == prd.updated_at
+
+    def test_extract_requirements_interns_repeated_phrases(self):
+        """Test that identical requirement strings share a single object."""
+        feature_content = (
+            "**Requirements:**\n- High availability\n- High availability\n"
+        )
+
+        first, second = self.agent._extract_requirements(feature_content)
+
+        assert first is second
+
+    def test_extract_features_from_tables_skips_documents_without_tables(self):
+        """Test that documents without any table yield no table features."""
+        with patch(
+            "marvin.core.agents.document_analysis._iter_feature_table_rows"
+        ) as iter_rows:
+            features = self.agent._extract_features_from_tables("## Features\n")
+
+        assert features == []
+        iter_rows.assert_not_called()
+
+    def test_extract_features_from_tables_reads_each_table_once(self):
+        """Test that table rows are parsed line by line, without duplicates."""
+        content = """## Requirements Matrix
+
+| ID | Feature | Priority | Effort | Owner | Dependencies |
+|----|---------|----------|--------|-------|--------------|
+| F1 | Login | 1 | 3d | Ann | None |
+| F2 | Logout | 3 | 1d | Bob | F1, F3 |
+
+Trailing paragraph | with a pipe
+"""
+
+        features = self.agent._extract_features_from_tables(content)
+
+        assert [f.id for f in features] == ["F1", "F2"]
+        assert features[1].dependencies == ["F1", "F3"]
+
+    def test_extract_features_from_tables_converts_textual_priorities(self):
+        """Test that priority cells such as "High" become integer priorities."""
+        content = """## Requirements Matrix
+
+| ID | Feature | Priority | Effort | Owner | Dependencies |
+|----|---------|----------|--------|-------|--------------|
+| F1 | Login | High | 3d | Ann | None |
+| F2 | Export | Medium | 2d | Bob | F1 |
+| F3 | Themes | Low | 1d | Cy | None |
+"""
+
+        features = self.agent._extract_features_from_tables(content)
+
+        assert all(isinstance(f.priority, int) for f in features)
+        assert [f.priority for f in features] == [0, 1, 2]
+
+    def test_extract_features_ignores_headings_in_code_blocks(self):
+        """Test that # lines inside fenced code blocks are not headings."""
+        content = """## Features
+
+### CLI Installer
+Installs the tool.
+
+```bash
+# install dependencies
+### not a feature
+```
+
+### Updater
+Keeps the tool up to date.
+"""
+        features = self.agent._extract_features(content)
+
+        assert [feature.title for feature in features] == ["CLI Installer", "Updater"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_markdown_reads_large_documents(self, tmp_path: Path):
+        """Test that large, memory-mapped documents are parsed like small ones."""
+        padding = "Lorem ipsum dolor sit amet.\n" * 20000
+        prd_file = tmp_path / "test_prd.md"
+        prd_file.write_text(
+            f"# PRD: Large App\n\n## Notes\n{padding}\n## Features\n\n### Login\nLog in.\n"
+        )
+
+        prd, features = await self.agent.execute(str(prd_file))
+
+        assert prd.title == "Large App"
+        assert [feature.name for feature in features] == ["Login"]
+
+    def test_analyze_markdown_basic_indexes_headings_once(self):
+        """Test that all extractors share a single heading scan."""
+        content = """# PRD: Indexed App
+
+## Overview
+An app whose overview ends the document"""
+
+        with patch(
+            "marvin.core.agents.document_analysis._split_sections",
+            wraps=document_analysis._split_sections,
+        ) as split_sections:
+            prd, features = self.agent._analyze_markdown_basic(content, "indexed.md")
+
+        split_sections.assert_called_once_with(content)
+        assert prd.title == "Indexed App"
+        assert prd.description == "An app whose overview ends the document"
+        assert features == []
+
+    def test_extract_version_and_author_beyond_document_head(self):
+        """Test that metadata past the scanned head is still found."""
+        head = "# PRD: App\n\nAUTHOR: Jane Doe\n"
+        tail = "x" * 5000 + "\nVersion: 2.1.0\n"
+
+        assert self.agent._extract_author(head + tail) == "Jane Doe"
+        assert self.agent._extract_version(head + tail) == "2.1.0"
+
+    def test_convert_priority_to_int_uses_shared_mapping(self):
+        """Test priority labels map to numbers and unknown labels default high."""
+        assert self.agent._convert_priority_to_int("Should Have") == 1
+        assert self.agent._convert_priority_to_int("Could") == 2
+        assert self.agent._convert_priority_to_int("Unheard of") == 0
+        with pytest.raises(TypeError):
+            document_analysis._PRIORITY_MAP["Low"] = 0  # type: ignore[index]
+
+    def test_extract_features_from_sections_skips_absent_parts(self):
+        """Test that extractors for parts a feature lacks are not run."""
+        content = """## Features
+
+### 1. Search
+Find items quickly.
+
+**Acceptance Criteria**
+- Results in under a second
+"""
+
+        with patch.object(self.agent, "_extract_user_stories") as user_stories:
+            features = self.agent._extract_features_from_sections(content)
+
+        user_stories.assert_not_called()
+        assert features[0].user_stories == []
+        assert features[0].requirements == []
+
+    def test_generate_dependency_graph_matches_titles_and_ids(self):
+        """Test that dependencies resolve by title substring or exact ID."""
+        features = [
+            Feature(id="auth", title="User Authentication", description=""),
+            Feature(
+                id="cart", title="Cart", description="", dependencies=["authentication"]
+            ),
+            Feature(
+                id="checkout",
+                title="Checkout",
+                description="",
+                dependencies=["cart", "auth"],
+            ),
+        ]
+
+        graph = self.agent._generate_dependency_graph(features)
+
+        assert graph == {"auth": [], "cart": ["auth"], "checkout": ["cart", "auth"]}
+
+    def test_analyze_markdown_basic_lazy_parses_features_on_access(self):
+        """Test that lazy analysis defers parsing each feature until accessed."""
+        content = """# PRD: Lazy App
+
+## Features
+
+### Login
+**Requirements:**
+- Password sign in
+
+### Logout
+Ends the session.
+"""
+
+        with patch.object(
+            self.agent, "_scan_feature_body", wraps=self.agent._scan_feature_body
+        ) as scan_feature_body:
+            prd, features = self.agent._analyze_markdown_basic(
+                content, "lazy.md", lazy=True
+            )
+
+            assert isinstance(features, document_analysis.LazyFeatures)
+            assert features.titles == ["Login", "Logout"]
+            scan_feature_body.assert_not_called()
+
+            assert features[-1].title == "Logout"
+            assert scan_feature_body.call_count == 1
+            assert features[1] is features[-1]
+            assert [f.requirements for f in features] == [["Password sign in"], []]
+
+    def test_extract_features_parses_on_threads_without_gil(self):
+        """Test that thread-parallel feature parsing keeps document order."""
+        content = "## Features\n\n" + "".join(
+            f"### Feature {n}: Part {n}\n**Requirements:**\n- Item {n}\n\n"
+            for n in range(1, 7)
+        )
+        sequential = self.agent._extract_features(content)
+
+        with patch(
+            "marvin.core.agents.document_analysis._gil_enabled", return_value=False
+        ):
+            parallel = self.agent._extract_features(content)
+
+        assert parallel == sequential
+        assert [f.title for f in parallel] == [f"Part {n}" for n in range(1, 7)]
+
+    def test_extract_requirements_strips_only_well_formed_ids(self):
+        """Test that only "REQ-N:" and "REQ-N.M:" prefixes are removed."""
+        feature_content = (
+            "**Requirements:**\n"
+            "- REQ-7: Audit log\n"
+            "* REQ-1.2:\tExport to CSV  \n"
+            "- REQ-x: Keep malformed IDs\n"
+            "- REQ-3:missing space\n"
+            "-  \n"
+            "- Not collected\n"
+        )
+
+        requirements = self.agent._extract_requirements(feature_content)
+
+        assert requirements == [
+            "Audit log",
+            "Export to CSV",
+            "REQ-x: Keep malformed IDs",
+            "REQ-3:missing space",
+        ]
+
+    def test_scan_feature_body_reads_description_and_requirements(self):
+        """Test that one scan yields the description and the requirements."""
+        feature_content = (
+            "Lets users sign in\n"
+            "with a password.\n"
+            "**Requirements:**\n"
+            "- Password sign in\n"
+            "#### 1.1 Recovery\n"
+            "**Requirements:**\n"
+            "- Reset link\n"
+        )
+
+        description, requirements = self.agent._scan_feature_body(feature_content)
+
+        assert description == "Lets users sign in with a password."
+        assert requirements == ["Password sign in", "Reset link"]
+
+    def test_extract_user_stories_skips_duplicate_simple_stories(self):
+        """Test that simple stories already collected are not added again."""
+        content = (
+            "- User can export reports\n"
+            "- User can export reports\n"
+            "- As a user, I want reports, so that I can share them\n"
+            "- Admin can revoke access\n"
+        )
+
+        stories = self.agent._extract_user_stories(content)
+
+        assert [(s.format, s.story) for s in stories] == [
+            ("as_a_user", "- As a user, I want reports, so that I can share them"),
+            ("simple", "- User can export reports"),
+            ("simple", "- Admin can revoke access"),
+        ]
+
+    def test_extract_dependencies_enhanced_reads_every_section_form(self):
+        """Test that each dependencies form is found in one scan."""
+        content = (
+            "#### Dependencies\n"
+            "- Billing (2.1)\n"
+            "\n"
+            "**Dependencies**: Search, Reports\n"
+            "Dependencies: Audit, Export\n"
+        )
+
+        dependencies = self.agent._extract_dependencies_enhanced(content)
+
+        assert sorted(dependencies) == [
+            "Audit",
+            "Billing",
+            "Export",
+            "Reports",
+            "Search",
+        ]
+
+    def test_extract_definition_of_done_stops_at_next_section(self):
+        """Test that a section body ends at the next heading or bold label."""
+        content = (
+            "#### Definition of Done\n"
+            "- [ ] Code reviewed\n"
+            "- Tests pass\n"
+            "**Notes**\n"
+            "- Not a DoD item\n"
+        )
+
+        items = self.agent._extract_definition_of_done(content)
+
+        assert items == ["Code reviewed", "Tests pass"]
+
+    def test_clean_dependency_strips_references_and_whitespace(self):
+        """Test that dependencies lose parenthetical references and extra spaces."""
+        assert document_analysis._clean_dependency("User  Profile (PROFILE-001)") == (
+            "User Profile"
+        )
+        assert document_analysis._clean_dependency(" Search\tService ") == (
+            "Search Service"
+        )
+
+    def test_extract_dependencies_enhanced_keeps_first_occurrence_order(self):
+        """Test that duplicate dependencies are dropped in document order."""
+        content = "#### Dependencies\n- Search\n- Billing\n- Search (2.1)\n- Audit\n"
+
+        dependencies = self.agent._extract_dependencies_enhanced(content)
+
+        assert dependencies == ["Search", "Billing", "Audit"]
+
+    def test_execute_stats_document_once(self, tmp_path: Path):
+        """Test that the existence check and the cache key share one stat."""
+        prd_file = tmp_path / "stat.md"
+        prd_file.write_text("# PRD: Stat\n\n## Overview\nChecks stat calls.\n")
+
+        with patch.object(
+            document_analysis.os, "stat", wraps=document_analysis.os.stat
+        ) as stat:
+            asyncio.run(self.agent.execute(str(prd_file)))
+
+        assert stat.call_count == 1
+
+    def test_read_document_normalizes_line_endings_across_chunks(self, tmp_path: Path):
+        """Test that CRLF pairs split between decode chunks become one LF."""
+        chunk_size = document_analysis._DECODE_CHUNK_SIZE
+        head = "é" * ((chunk_size - 1) // 2) + "x"  # Ends one byte before a chunk
+        body = head + "\r\n" + "Line\r\n" * (document_analysis._MMAP_THRESHOLD // 6)
+        prd_file = tmp_path / "crlf.md"
+        prd_file.write_bytes(body.encode("utf-8"))
+
+        content = DocumentAnalysisAgent._read_document(str(prd_file))
+
+        assert "\r" not in content
+        assert content == body.replace("\r\n", "\n")
+
+    def test_extract_priority_keeps_keyword_precedence(self):
+        """Test that higher priorities win regardless of keyword position."""
+        assert self.agent._extract_priority("**Priority:** Low (was P0)") == 0
+        assert self.agent._extract_priority("**Priority:** p2, maybe medium") == 1
+        assert self.agent._extract_priority("**Priority:** Low") == 2
+        assert (
+            self.agent._extract_priority_from_text(
+                "Nice to have, but critical for launch"
+            )
+            == "High"
+        )
@@ -0,0 +1,238 @@
+"""
+Unit tests for domain entities.
+"""
+
+import sys
+from uuid import uuid4
+
+from marvin.core.domain.entities.codebase import (
+    CodebaseAnalysis,
+    Component,
+    ComponentGraph,
+    ComponentType,
+)
+from marvin.core.domain.entities.prd import (
+    FeatureSpecification,
+    PRDDocument,
+    PriorityLevel,
+)
+from marvin.core.domain.entities.task import TaskContext, TaskDefinition, TaskSequence
+
+
+def _task(*prerequisites):
+    """Creates a task with the given prerequisites."""
+    return TaskDefinition(
+        context=TaskContext(feature_id=uuid4()), prerequisites=list(prerequisites)
+    )
+
+
+class TestTaskSequence:
+    """Test cases for TaskSequence."""
+
+    def test_execution_order_lists_prerequisites_first(self):
+        """Test that tasks added before their prerequisites are reordered."""
+        database = _task()
+        api = _task(database.id)
+        ui = _task(api.id, uuid4())
+        sequence = TaskSequence()
+
+        for task in (ui, api, database):
+            sequence.add_task(task)
+
+        assert sequence.execution_order == [database.id, api.id, ui.id]
+
+    def test_execution_order_handles_chains_deeper_than_recursion_limit(self):
+        """Test that long prerequisite chains do not recurse."""
+        tasks = [_task()]
+        for _ in range(sys.getrecursionlimit() + 100):
+            tasks.append(_task(tasks[-1].id))
+        sequence = TaskSequence(tasks=tasks[:0:-1])
+
+        sequence.add_task(tasks[0])
+
+        assert sequence.execution_order == [task.id for task in tasks]
+
+    def test_add_tasks_orders_the_whole_batch(self):
+        """Test that a batch of tasks is ordered once, prerequisites first."""
+        database = _task()
+        api = _task(database.id)
+        ui = _task(api.id)
+        sequence = TaskSequence()
+
+        sequence.add_tasks([ui, api, database])
+
+        assert sequence.tasks == [ui, api, database]
+        assert sequence.execution_order == [database.id, api.id, ui.id]
+
+    def test_get_next_tasks_returns_open_tasks_with_completed_prerequisites(self):
+        """Test that only unblocked, unfinished tasks are returned."""
+        database = _task()
+        api = _task(database.id)
+        ui = _task(api.id)
+        docs = _task()
+        sequence = TaskSequence(tasks=[database, api, ui, docs])
+
+        assert sequence.get_next_tasks(set()) == [database, docs]
+        assert sequence.get_next_tasks({database.id}) == [api, docs]
+
+
+class TestComponentGraph:
+    """Test cases for ComponentGraph."""
+
+    def test_get_dependents_returns_components_depending_on_component(self):
+        """Test that dependents are found through the reverse index."""
+        models = Component(name="models")
+        api = Component(name="api", dependencies=[models.id])
+        cli = Component(name="cli", dependencies=[api.id, models.id])
+        graph = ComponentGraph()
+
+        for component in (models, api, cli):
+            graph.add_component(component)
+
+        assert graph.get_dependents(models.id) == {api, cli}
+        assert graph.get_dependents(cli.id) == set()
+        assert graph.get_dependencies(cli.id) == {api, models}
+
+    def test_get_dependents_sees_edges_passed_to_constructor(self):
+        """Test that initial edges are indexed too."""
+        models = Component(name="models")
+        api = Component(name="api")
+        graph = ComponentGraph(
+            components={models.id: models, api.id: api},
+            edges={models.id: set(), api.id: {models.id}},
+        )
+
+        assert graph.get_dependents(models.id) == {api}
+
+    def test_components_compare_and_hash_by_id(self):
+        """Test that component identity ignores the other fields."""
+        component = Component(name="api")
+        renamed = Component(id=component.id, name="http-api")
+
+        assert component == renamed
+        assert component != Component(name="api")
+        assert {component, renamed} == {component}
+
+    def test_add_components_indexes_a_batch(self):
+        """Test that a batch of components is added with its edges."""
+        models = Component(name="models")
+        api = Component(name="api", dependencies=[models.id])
+        graph = ComponentGraph()
+        graph.transitive_dependencies(api.id)
+
+        graph.add_components([api, models])
+
+        assert graph.components == {api.id: api, models.id: models}
+        assert graph.edges == {api.id: {models.id}, models.id: set()}
+        assert graph.get_dependents(models.id) == {api}
+        assert graph.transitive_dependencies(api.id) == {models.id}
+
+    def test_transitive_dependencies_follow_chains_and_cycles(self):
+        """Test that closures cover indirect dependencies and are shared across cycles."""
+        models = Component(name="models")
+        repo = Component(name="repo", dependencies=[models.id])
+        service = Component(name="service", dependencies=[repo.id])
+        api = Component(name="api", dependencies=[service.id])
+        service.dependencies.append(api.id)
+        graph = ComponentGraph()
+
+        for component in (models, repo, service, api):
+            graph.add_component(component)
+
+        assert graph.transitive_dependencies(models.id) == frozenset()
+        assert graph.transitive_dependencies(repo.id) == {models.id}
+        assert graph.transitive_dependencies(service.id) == {
+            service.id,
+            api.id,
+            repo.id,
+            models.id,
+        }
+        assert graph.transitive_dependencies(api.id) == graph.transitive_dependencies(
+            service.id
+        )
+
+        cli = Component(name="cli", dependencies=[repo.id])
+        graph.add_component(cli)
+
+        assert graph.transitive_dependencies(cli.id) == {repo.id, models.id}
+
+
+class TestCodebaseAnalysis:
+    """Test cases for CodebaseAnalysis."""
+
+    def test_entry_points_are_derived_from_the_component_graph(self):
+        """Test that entry points track components however they were added."""
+        api = Component(name="api", type=ComponentType.API_ENDPOINT)
+        models = Component(name="models", type=ComponentType.MODULE)
+        service = Component(name="service", type=ComponentType.SERVICE)
+        analysis = CodebaseAnalysis()
+
+        analysis.add_component(api)
+        analysis.add_component(models)
+        analysis.add_component(api)
+        analysis.component_graph.add_component(service)
+
+        assert analysis.entry_points == [api, service]
+
+
+class TestPRDDocument:
+    """Test cases for PRDDocument."""
+
+    def test_get_features_by_priority_keeps_document_order(self):
+        """Test that features are grouped by priority, including initial ones."""
+        login = FeatureSpecification(name="login", priority=PriorityLevel.HIGH)
+        export = FeatureSpecification(name="export", priority=PriorityLevel.LOW)
+        search = FeatureSpecification(name="search", priority=PriorityLevel.HIGH)
+        prd = PRDDocument(features=[login, export])
+
+        prd.add_feature(search)
+
+        assert prd.get_features_by_priority(PriorityLevel.HIGH) == [login, search]
+        assert prd.get_features_by_priority(PriorityLevel.LOW) == [export]
+        assert prd.get_features_by_priority(PriorityLevel.CRITICAL) == []
+
+        prd.get_features_by_priority(PriorityLevel.HIGH).clear()
+        assert prd.get_features_by_priority(PriorityLevel.HIGH) == [login, search]
+
+    def test_get_features_by_priority_follows_direct_feature_edits(self):
+        """Test that features appended or changed in place are seen."""
+        login = FeatureSpecification(name="login", priority=PriorityLevel.HIGH)
+        export = FeatureSpecification(name="export", priority=PriorityLevel.LOW)
+        prd = PRDDocument(features=[login])
+        assert prd.get_features_by_priority(PriorityLevel.HIGH) == [login]
+
+        prd.features.append(export)
+        assert prd.get_features_by_priority(PriorityLevel.LOW) == [export]
+
+        login.priority = PriorityLevel.LOW
+        assert prd.get_features_by_priority(PriorityLevel.HIGH) == []
+        assert prd.get_features_by_priority(PriorityLevel.LOW) == [login, export]
+
+        prd.features.remove(export)
+        assert prd.get_features_by_priority(PriorityLevel.LOW) == [login]
+
+    def test_get_dependency_graph_is_rebuilt_after_adding_features(self):
+        """Test that each graph is a new dict and follows add_feature."""
+        login = FeatureSpecification(name="login")
+        profile = FeatureSpecification(name="profile", dependencies=[login.id])
+        prd = PRDDocument(features=[login])
+
+        graph = prd.get_dependency_graph()
+        graph.clear()
+        assert prd.get_dependency_graph() == {login.id: []}
+
+        prd.add_feature(profile)
+        assert prd.get_dependency_graph() == {login.id: [], profile.id: [login.id]}
+
+    def test_get_dependency_graph_follows_direct_feature_edits(self):
+        """Test that the graph sees features appended or changed in place."""
+        login = FeatureSpecification(name="login")
+        profile = FeatureSpecification(name="profile")
+        prd = PRDDocument(features=[login])
+        assert prd.get_dependency_graph() == {login.id: []}
+
+        prd.features.append(profile)
+        assert prd.get_dependency_graph() == {login.id: [], profile.id: []}
+
+        profile.dependencies = [login.id]
+        assert prd.get_dependency_graph() == {login.id: [], profile.id: [login.id]}
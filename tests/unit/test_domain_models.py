@@ -6,6 +6,9 @@ Following TDD approach - write tests first, then implement.
 
 from datetime import datetime
 
+import pytest
+from pydantic import ValidationError
+
 from marvin.core.domain.models import (
     PRD,
     Codebase,
@@ -110,6 +113,28 @@ class TestPRDModel:
         assert prd.features[0] == feature
         assert prd.updated_at > original_updated
 
+    def test_prd_add_features(self):
+        """Test that several features can be added to a PRD at once."""
+        now = datetime.now()
+        prd = PRD(
+            id="prd-001",
+            title="Task Management System",
+            description="A system for managing tasks",
+            author="Test Author",
+            created_at=now,
+            updated_at=now,
+            version="1.0.0",
+        )
+        features = [
+            Feature(id=f"feat-{n:03d}", title=f"Feature {n}", description="Feature")
+            for n in range(1, 4)
+        ]
+
+        prd.add_features(iter(features))
+
+        assert prd.features == features
+        assert prd.updated_at > now
+
 
 class TestCodebaseModel:
     """Test cases for Codebase domain model."""
@@ -247,3 +272,72 @@ class TestWorkflowModel:
         assert workflow.tasks[1].task_id == "task-002"
         assert workflow.tasks[2].task_id == "task-003"
         assert workflow.updated_at > original_updated
+
+    def test_workflow_add_task_keeps_insertion_order_for_equal_sequence(self):
+        """Test that tasks sharing a sequence number stay in insertion order."""
+        workflow = Workflow(
+            id="wf-001",
+            name="MVP Implementation",
+            description="Workflow for MVP features",
+            prd_id="prd-001",
+        )
+        tasks = [
+            Task(
+                task_id=f"task-{n:03d}",
+                sequence_number=sequence,
+                name=f"Task {n}",
+                description="Task",
+                feature_id="feat-001",
+            )
+            for n, sequence in enumerate([2, 1, 2, 1, 3], start=1)
+        ]
+
+        for task in tasks:
+            workflow.add_task(task)
+
+        assert [t.task_id for t in workflow.tasks] == [
+            "task-002",
+            "task-004",
+            "task-001",
+            "task-003",
+            "task-005",
+        ]
+
+
+class TestFromDict:
+    """Test cases for validated construction from untrusted data."""
+
+    def test_from_dict_coerces_nested_and_enum_values(self):
+        """Test that from_dict validates nested models and enum strings."""
+        feature = Feature.from_dict(
+            {
+                "id": "feat-001",
+                "title": "User Authentication",
+                "description": "Users can log in",
+                "status": "accepted",
+                "user_stories": [{"story": "As a user, I want to log in"}],
+            }
+        )
+
+        assert feature.status is FeatureStatus.ACCEPTED
+        assert feature.user_stories[0].story == "As a user, I want to log in"
+        assert not hasattr(feature, "__dict__")
+
+    def test_from_dict_rejects_invalid_data(self):
+        """Test that from_dict raises on missing or mistyped fields."""
+        with pytest.raises(ValidationError):
+            Feature.from_dict({"id": "feat-001", "priority": "high"})
+
+    def test_list_from_dicts_validates_a_batch(self):
+        """Test that list_from_dicts builds every row and reports bad ones."""
+        rows = [
+            {"id": f"feat-{n:03d}", "title": f"Feature {n}", "description": "Feature"}
+            for n in range(1, 4)
+        ]
+
+        features = Feature.list_from_dicts(rows)
+
+        assert [f.id for f in features] == ["feat-001", "feat-002", "feat-003"]
+        assert all(isinstance(f, Feature) for f in features)
+        with pytest.raises(ValidationError):
+            Feature.list_from_dicts([*rows, {"id": "feat-004"}])
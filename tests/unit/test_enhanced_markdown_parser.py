@@ -345,7 +345,7 @@ Implement global search across all content types.
         reg_feature = next((f for f in features if f.id == "F001"), None)
         assert reg_feature is not None
         assert reg_feature.title == "User Registration"
-        assert reg_feature.priority == "High"
+        assert reg_feature.priority == 0
         assert reg_feature.effort == "8 SP"
 
         payment_feature = next((f for f in features if f.id == "F003"), None)
@@ -0,0 +1,145 @@
+"""
+Unit tests for ProcessPRDUseCase.
+"""
+
+import asyncio
+import sys
+import types
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from marvin.core.domain.entities.analysis import AnalysisContext
+from marvin.core.domain.entities.task import TaskContext, TaskDefinition, TaskSequence
+from marvin.core.domain.services import (
+    CodebaseScanner,
+    PRDAnalyzer,
+    TaskSequencer,
+    TemplateGenerator,
+)
+
+# The application package's __init__ imports use cases that are not in the
+# tree, so register a bare package to import the module on its own
+if "marvin.core.application" not in sys.modules:
+    _application = types.ModuleType("marvin.core.application")
+    _application.__path__ = [
+        str(Path(__file__).parents[2] / "src" / "marvin" / "core" / "application")
+    ]
+    sys.modules["marvin.core.application"] = _application
+
+from marvin.core.application.process_prd_use_case import (  # noqa: E402
+    ProcessPRDUseCase,
+)
+
+
+class FakeAIService:
+    """AI service double that records calls and never finishes codebase scans."""
+
+    def __init__(self) -> None:
+        self.feature_calls = 0
+        self.templates_in_flight = 0
+        self.peak_templates_in_flight = 0
+
+    async def extract_features(self, content: str) -> list[dict]:
+        self.feature_calls += 1
+        return [{"name": "Login", "requirements": ["Password"]}]
+
+    async def analyze_codebase(self, file_contents: dict[str, str]) -> dict:
+        await asyncio.sleep(3600)
+        return {}
+
+    async def generate_xml_template(self, task: dict, context: dict) -> str:
+        self.templates_in_flight += 1
+        self.peak_templates_in_flight = max(
+            self.peak_templates_in_flight, self.templates_in_flight
+        )
+        await asyncio.sleep(0.01)
+        self.templates_in_flight -= 1
+        return f"<task>{task['name']}</task>"
+
+
+async def _fail_scan(file_contents: dict[str, str]) -> dict:
+    """Codebase analysis that fails immediately."""
+    raise RuntimeError("scan failed")
+
+
+def _use_case(ai_service: FakeAIService, **kwargs) -> ProcessPRDUseCase:
+    """Creates a use case with real domain services and the given AI service."""
+    return ProcessPRDUseCase(
+        PRDAnalyzer(),
+        CodebaseScanner(),
+        TaskSequencer(),
+        TemplateGenerator(),
+        ai_service,
+        **kwargs,
+    )
+
+
+class TestExecute:
+    """Test cases for ProcessPRDUseCase.execute."""
+
+    async def test_failed_prd_analysis_cancels_codebase_scan(self, tmp_path: Path):
+        """Test that the concurrent codebase scan does not outlive a failure."""
+        use_case = _use_case(FakeAIService())
+
+        with pytest.raises(FileNotFoundError):
+            await use_case.execute(tmp_path / "missing.md", codebase_path=tmp_path)
+
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    async def test_failed_codebase_scan_raises_original_error(self, tmp_path: Path):
+        """Test that a step's own error reaches the caller, not its group."""
+        prd_path = tmp_path / "prd.md"
+        prd_path.write_text("# PRD\n")
+        ai_service = FakeAIService()
+        ai_service.analyze_codebase = _fail_scan
+        use_case = _use_case(ai_service)
+
+        with pytest.raises(RuntimeError, match="scan failed") as error:
+            await use_case.execute(prd_path, codebase_path=tmp_path)
+
+        assert type(error.value) is RuntimeError
+        assert error.value.__suppress_context__
+
+
+class TestExtractFeatures:
+    """Test cases for the AI feature-extraction cache."""
+
+    async def test_repeated_content_hits_cache_with_independent_copies(self):
+        """Test that unchanged PRDs skip the AI call and get their own list."""
+        ai_service = FakeAIService()
+        use_case = _use_case(ai_service)
+
+        first = await use_case._extract_features("# PRD")
+        first[0]["requirements"].append("Mutated")
+        first.append({"name": "Extra"})
+        second = await use_case._extract_features("# PRD")
+
+        assert ai_service.feature_calls == 1
+        assert second == [{"name": "Login", "requirements": ["Password"]}]
+        assert second is not first
+
+
+class TestGenerateTemplates:
+    """Test cases for concurrent template generation."""
+
+    async def test_ai_requests_never_exceed_max_concurrent_ai(self):
+        """Test that template requests overlap but stay within the limit."""
+        ai_service = FakeAIService()
+        use_case = _use_case(ai_service, max_concurrent_ai=3)
+        sequence = TaskSequence(
+            tasks=[
+                TaskDefinition(
+                    name=f"Task {n}", context=TaskContext(feature_id=uuid4())
+                )
+                for n in range(10)
+            ]
+        )
+
+        templates = await use_case._generate_templates(sequence, AnalysisContext())
+
+        assert ai_service.peak_templates_in_flight == 3
+        assert templates == {
+            task.id: f"<task>{task.name}</task>" for task in sequence.tasks
+        }
@@ -0,0 +1,167 @@
+"""
+Unit tests for SequencePlannerAgent and its dependency graph.
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+
+from marvin.core.agents.sequence_planner import DependencyGraph, SequencePlannerAgent
+from marvin.core.domain.models import PRD, Feature
+
+
+class TestDependencyGraph:
+    """Test cases for DependencyGraph."""
+
+    def test_topological_sort_orders_dependents_first(self):
+        """Test that an acyclic graph is sorted with dependents first."""
+        graph = DependencyGraph()
+        graph.add_edge("dashboard", "auth")
+        graph.add_edge("auth", "storage")
+
+        assert not graph.has_cycle()
+        assert graph.topological_sort() == ["dashboard", "auth", "storage"]
+
+    def test_strongly_connected_components_groups_cycles(self):
+        """Test that cycles form one component, after their dependencies."""
+        graph = DependencyGraph()
+        graph.add_edge("a", "b")
+        graph.add_edge("b", "a")
+        graph.add_edge("b", "c")
+        graph.add_edge("d", "a")
+
+        components = graph.strongly_connected_components()
+
+        assert components == [["c"], ["a", "b"], ["d"]]
+        assert graph.has_cycle()
+
+    def test_has_cycle_detects_self_dependency(self):
+        """Test that a feature depending on itself is a cycle."""
+        graph = DependencyGraph()
+        graph.add_edge("a", "a")
+
+        assert graph.strongly_connected_components() == [["a"]]
+        assert graph.has_cycle()
+
+    def test_topological_sort_handles_chains_deeper_than_recursion_limit(self):
+        """Test that long dependency chains do not recurse."""
+        graph = DependencyGraph()
+        depth = sys.getrecursionlimit() + 100
+        for i in range(depth):
+            graph.add_edge(f"f{i}", f"f{i + 1}")
+
+        assert not graph.has_cycle()
+        assert graph.topological_sort() == [f"f{i}" for i in range(depth + 1)]
+
+    def test_copy_does_not_share_edge_sets(self):
+        """Test that edges removed from a copy stay in the original."""
+        graph = DependencyGraph()
+        graph.add_edge("a", "b")
+
+        copied = graph.copy()
+        copied.nodes["a"].remove("b")
+
+        assert graph.nodes == {"a": {"b"}, "b": set()}
+        assert copied.nodes == {"a": set(), "b": set()}
+
+
+class TestSequencePlannerAgent:
+    """Test cases for SequencePlannerAgent."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.agent = SequencePlannerAgent()
+
+    def test_resolve_cyclic_dependencies_removes_edge_with_lowest_priority_value(self):
+        """Test that the cycle is broken at its lowest priority sum."""
+        features = [
+            Feature(id="a", title="A", description="A", dependencies=["b"], priority=0),
+            Feature(id="b", title="B", description="B", dependencies=["c"], priority=2),
+            Feature(id="c", title="C", description="C", dependencies=["a"], priority=0),
+        ]
+        graph = asyncio.run(self.agent._build_dependency_graph(features))
+
+        sequence = asyncio.run(self.agent._resolve_cyclic_dependencies(features, graph))
+
+        assert sequence == ["a", "b", "c"]
+        assert graph.has_cycle()
+
+    def test_resolve_cyclic_dependencies_breaks_cycles_left_after_a_removal(self):
+        """Test that a component still cyclic after one removal is broken again."""
+        features = [
+            Feature(id="a", title="A", description="A", dependencies=["b"], priority=0),
+            Feature(
+                id="b", title="B", description="B", dependencies=["a", "c"], priority=1
+            ),
+            Feature(id="c", title="C", description="C", dependencies=["b"], priority=2),
+        ]
+        graph = asyncio.run(self.agent._build_dependency_graph(features))
+
+        sequence = asyncio.run(self.agent._resolve_cyclic_dependencies(features, graph))
+
+        assert sorted(sequence) == ["a", "b", "c"]
+
+    def test_resolve_cyclic_dependencies_keeps_edges_outside_cycles(self):
+        """Test that only edges inside a cycle are removed."""
+        features = [
+            Feature(id="a", title="A", description="A", dependencies=["b"], priority=2),
+            Feature(id="b", title="B", description="B", dependencies=["a"], priority=2),
+            Feature(id="c", title="C", description="C", priority=0),
+            Feature(id="d", title="D", description="D", dependencies=["c"], priority=0),
+        ]
+        graph = asyncio.run(self.agent._build_dependency_graph(features))
+
+        sequence = asyncio.run(self.agent._resolve_cyclic_dependencies(features, graph))
+
+        assert sequence == ["d", "c", "b", "a"]
+
+    def test_execute_links_tasks_to_known_dependencies(self):
+        """Test that tasks depend only on features present in the PRD."""
+        prd = PRD(
+            id="prd",
+            title="Shop",
+            description="An online shop",
+            author="Team",
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            version="1.0.0",
+            features=[
+                Feature(
+                    id="cart",
+                    title="Cart",
+                    description="Cart",
+                    dependencies=["auth", "legacy"],
+                ),
+                Feature(id="auth", title="Auth", description="Auth"),
+            ],
+        )
+
+        workflow = asyncio.run(self.agent.execute(prd))
+
+        assert [(t.task_id, t.depends_on) for t in workflow.tasks] == [
+            ("task_cart", ["task_auth"]),
+            ("task_auth", []),
+        ]
+
+    def test_execute_numbers_only_created_tasks(self):
+        """Test that unknown dependencies do not consume sequence numbers."""
+        prd = PRD(
+            id="prd",
+            title="Shop",
+            description="An online shop",
+            author="Team",
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            version="1.0.0",
+            features=[
+                Feature(
+                    id="cart", title="Cart", description="Cart", dependencies=["legacy"]
+                ),
+                Feature(id="auth", title="Auth", description="Auth"),
+            ],
+        )
+
+        workflow = asyncio.run(self.agent.execute(prd))
+
+        assert [t.sequence_number for t in workflow.tasks] == [1, 2]
+        assert {t.created_at for t in workflow.tasks} == {workflow.created_at}
@@ -0,0 +1,103 @@
+"""
+Unit tests for TemplateGenerationAgent.
+"""
+
+import asyncio
+from datetime import datetime
+
+from marvin.core.agents.template_generation import TemplateGenerationAgent
+from marvin.core.domain.models import PRD, Codebase, Component, Feature, Task
+
+
+class TestTemplateGenerationAgent:
+    """Test cases for TemplateGenerationAgent."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.agent = TemplateGenerationAgent()
+        self.prd = PRD(
+            id="prd",
+            title="PRD: Shop",
+            description="An online shop",
+            author="Team",
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            version="1.0.0",
+        )
+
+    def _context(self, feature: Feature, codebase: Codebase) -> dict:
+        task = Task(
+            task_id=f"task_{feature.id}",
+            sequence_number=1,
+            name=f"Implement {feature.name}",
+            description=feature.description,
+            feature_id=feature.id,
+        )
+        return asyncio.run(
+            self.agent._prepare_additional_context(task, feature, self.prd, codebase)
+        )
+
+    def test_prepare_additional_context_matches_component_names(self):
+        """Test that components named in the feature title are listed."""
+        codebase = Codebase(
+            id="shop",
+            name="Shop",
+            root_path="/shop",
+            components=[
+                Component(name="Cart", path="src/cart.py", type="file"),
+                Component(name="checkout", path="src/checkout", type="directory"),
+                Component(name="Search", path="src/search.py", type="file"),
+            ],
+        )
+        feature = Feature(id="cart", title="Cart Checkout", description="Pay")
+
+        context = self._context(feature, codebase)
+
+        assert context["affected_files"] == "src/cart.py"
+        assert context["affected_folders"] == "src/checkout"
+
+    def test_prepare_additional_context_sees_added_components(self):
+        """Test that the component index follows components added later."""
+        codebase = Codebase(id="shop", name="Shop", root_path="/shop")
+        feature = Feature(id="cart", title="Cart", description="Cart")
+        assert self._context(feature, codebase)["affected_files"] == ""
+
+        codebase.add_component(Component(name="cart", path="src/cart.py", type="file"))
+
+        assert self._context(feature, codebase)["affected_files"] == "src/cart.py"
+
+    def test_prepare_additional_context_sees_replaced_components(self):
+        """Test that replacing a component in place is picked up."""
+        codebase = Codebase(
+            id="shop",
+            name="Shop",
+            root_path="/shop",
+            components=[Component(name="cart", path="src/cart.py", type="file")],
+        )
+        feature = Feature(id="cart", title="Cart", description="Cart")
+        assert self._context(feature, codebase)["affected_files"] == "src/cart.py"
+
+        codebase.components[0] = Component(
+            name="cart", path="src/basket.py", type="file"
+        )
+
+        assert self._context(feature, codebase)["affected_files"] == "src/basket.py"
+
+    def test_execute_creates_missing_output_directory(self, tmp_path):
+        """Test that the template is saved into a directory that did not exist."""
+        feature = Feature(id="cart", title="Cart", description="Cart")
+        task = Task(
+            task_id="task_cart",
+            sequence_number=1,
+            name="Implement Cart",
+            description="Cart",
+            feature_id="cart",
+        )
+        output_dir = tmp_path / "templates" / "shop"
+
+        output_path = asyncio.run(
+            self.agent.execute(task, feature, self.prd, str(output_dir))
+        )
+
+        assert output_path == str(output_dir / "01_cart_task_cart.xml")
+        assert (output_dir / "01_cart_task_cart.xml").read_text(encoding="utf-8")
@@ -19,7 +19,10 @@ from marvin.core.domain.models import (
     Task,
     Technology,
 )
-from marvin.infrastructure.template_generator.xml_generator import XMLTemplateGenerator
+from marvin.infrastructure.template_generator.xml_generator import (
+    XMLTemplateGenerator,
+    _template_placeholders,
+)
 
 
 class TestXMLTemplateGenerator:
@@ -382,3 +385,16 @@ class TestXMLTemplateGenerator:
         # Assert - Should still generate valid XML
         is_valid, error = self.generator.validate_xml(xml_content)
         assert is_valid, f"XML should be valid even with empty codebase: {error}"
+
+
+def test_template_placeholders_scanned_once():
+    """Test that generators share the placeholder scan of a template."""
+    _template_placeholders.cache_clear()
+
+    for generator in (XMLTemplateGenerator(), XMLTemplateGenerator()):
+        context: dict[str, str] = {}
+        generator._fill_missing_placeholders(context)
+        assert context["glossary"] == ""
+
+    info = _template_placeholders.cache_info()
+    assert (info.misses, info.hits) == (1, 1)